@@ -11,6 +11,8 @@ Usage:
 """
 
 import argparse
+import hashlib
+import importlib.metadata
 import os
 import shutil
 import subprocess
@@ -21,6 +23,9 @@ from pathlib import Path
 class Builder:
     """Build Hospital PDF Manager executables."""
 
+    # Distribution names of required build dependencies (lowercase)
+    REQUIRED_PACKAGES = ("pyinstaller", "pyside6", "pypdf", "reportlab")
+
     def __init__(self, project_dir=None):
         """Initialize builder."""
         self.project_dir = Path(project_dir or Path(__file__).parent).resolve()
@@ -55,32 +60,58 @@ class Builder:
             print(f"[ERROR] {description} failed: {str(e)}\n")
             return False
 
+    def _dependency_check_key(self):
+        """Hash of pyproject.toml plus interpreter path, for the check cache."""
+        pyproject = self.project_dir / "pyproject.toml"
+        hasher = hashlib.sha256()
+        hasher.update(sys.executable.encode())
+        if pyproject.exists():
+            hasher.update(pyproject.read_bytes())
+        return hasher.hexdigest()
+
     def check_dependencies(self):
         """Check if required dependencies are installed."""
         self.print_header("Checking Dependencies")
 
-        # Map package names to import names (handle casing differences)
-        required = {
-            "PyInstaller": "pyinstaller",
-            "PySide6": "pyside6",
-            "pypdf": "pypdf",
-            "reportlab": "reportlab"
+        # Skip the distributions scan when a previous run already passed for
+        # this interpreter and an unchanged pyproject.toml
+        check_key = self._dependency_check_key()
+        cache_file = self.build_dir / ".depcheck"
+        try:
+            if cache_file.read_text().strip() == check_key:
+                print("[OK] Dependencies unchanged since last successful check\n")
+                return True
+        except OSError:
+            pass
+
+        # Snapshot installed distributions once instead of importing each
+        # package (imports pull in Qt/reportlab just to probe availability)
+        installed = {
+            dist.metadata["Name"].lower()
+            for dist in importlib.metadata.distributions()
+            if dist.metadata["Name"]
         }
         missing = []
 
-        for import_name, display_name in required.items():
-            try:
-                __import__(import_name)
-                print(f"[OK] {display_name} is installed")
-            except ImportError:
-                print(f"[ERROR] {display_name} is not installed")
-                missing.append(display_name)
+        for package in self.REQUIRED_PACKAGES:
+            if package in installed:
+                print(f"[OK] {package} is installed")
+            else:
+                print(f"[ERROR] {package} is not installed")
+                missing.append(package)
 
         if missing:
             print(f"\n[ERROR] Missing packages: {', '.join(missing)}")
             print("Install with: pip install -e '.[build]'")
             return False
 
+        # Record the successful check so unchanged setups skip the scan
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(check_key)
+        except OSError:
+            pass
+
         print("\n[OK] All dependencies are installed\n")
         return True
 
@@ -114,15 +145,11 @@ class Builder:
         if not self.check_dependencies():
             return False
 
-        # Run PyInstaller with spec file (no extra flags needed)
-        cmd = [
-            sys.executable,
-            "-m",
-            "PyInstaller",
-            str(self.spec_file),
-        ]
+        # Keep PyInstaller's work directory between runs so unchanged
+        # modules are reused, wiping it only when the spec file changed
+        self._invalidate_stale_build_cache()
 
-        if not self.run_command(cmd, "PyInstaller build"):
+        if not self._run_pyinstaller():
             return False
 
         # Platform-specific post-processing
@@ -135,6 +162,59 @@ class Builder:
 
         return True
 
+    def _run_pyinstaller(self):
+        """Run PyInstaller in-process, falling back to a subprocess."""
+        print("[*] PyInstaller build...")
+        try:
+            # Calling PyInstaller directly avoids spawning a second
+            # interpreter that re-imports the whole toolchain
+            from PyInstaller.__main__ import run as pyinstaller_run
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(self.project_dir)
+                pyinstaller_run([str(self.spec_file)])
+            finally:
+                os.chdir(cwd)
+            print("[OK] PyInstaller build completed\n")
+            return True
+        except ImportError:
+            # PyInstaller not importable in this interpreter; run it as a
+            # module the old way
+            cmd = [sys.executable, "-m", "PyInstaller", str(self.spec_file)]
+            return self.run_command(cmd, "PyInstaller build")
+        except SystemExit as e:
+            if e.code in (0, None):
+                print("[OK] PyInstaller build completed\n")
+                return True
+            print(f"[ERROR] PyInstaller build failed with exit code {e.code}\n")
+            return False
+        except Exception as e:
+            print(f"[ERROR] PyInstaller build failed: {str(e)}\n")
+            return False
+
+    def _invalidate_stale_build_cache(self):
+        """Wipe the incremental build directory if the spec file changed."""
+        hash_file = self.build_dir / ".spechash"
+        spec_hash = ""
+        if self.spec_file.exists():
+            spec_hash = hashlib.sha256(self.spec_file.read_bytes()).hexdigest()
+
+        try:
+            cached_hash = hash_file.read_text().strip()
+        except OSError:
+            cached_hash = None
+
+        if cached_hash is not None and cached_hash != spec_hash:
+            print("[*] Spec file changed, clearing incremental build cache...")
+            shutil.rmtree(self.build_dir, ignore_errors=True)
+
+        try:
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            hash_file.write_text(spec_hash)
+        except OSError:
+            pass
+
     def _post_process_windows(self):
         """Post-process Windows build."""
         self.print_header("Post-processing Windows Build")
@@ -206,6 +286,24 @@ class Builder:
         except:
             return "Unknown"
 
+    @staticmethod
+    def _dir_size(path):
+        """Total size in bytes of all files under path, via os.scandir.
+
+        scandir reuses the stat data returned by the directory read instead
+        of issuing a separate stat call per file like Path.rglob does.
+        """
+        total = 0
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        return total
+
     def show_build_info(self):
         """Show build information."""
         self.print_header("Build Complete")
@@ -217,8 +315,7 @@ class Builder:
             print("Contents:")
             for item in self.dist_dir.iterdir():
                 if item.is_dir():
-                    size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                    size_mb = size / (1024 * 1024)
+                    size_mb = self._dir_size(item) / (1024 * 1024)
                     print(f"  [DIR] {item.name}/ ({size_mb:.2f} MB)")
                 else:
                     size = item.stat().st_size / (1024 * 1024)
@@ -4,8 +4,6 @@ import sys
 
 from PySide6.QtWidgets import QApplication
 
-from ui.main_window import MainWindow
-
 
 def main():
     """Initialize and run the application."""
@@ -15,6 +13,10 @@ def main():
     app.setApplicationName("Homer PDF Manager")
     app.setApplicationVersion("0.1.0")
 
+    # Import after the QApplication exists so the pypdf/reportlab import
+    # cost is paid while the process is already visible to the user
+    from ui.main_window import MainWindow
+
     # Create and show main window
     window = MainWindow()
     window.show()
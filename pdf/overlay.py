@@ -1,10 +1,203 @@
 """Text overlay creation for PDFs using reportlab."""
 
+import time
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+
+@lru_cache(maxsize=256)
+def _text_width(text: str, font_name: str, font_size: int) -> float:
+    """
+    Measure text width via the font metrics tables directly.
+
+    Bypasses the Canvas.stringWidth indirection and caches the result,
+    since the same hospital-number text is measured for every page size.
+
+    Args:
+        text: Text to measure
+        font_name: Font name (e.g., "Helvetica")
+        font_size: Font size in points
+
+    Returns:
+        Width of the rendered text in points
+    """
+    # Imported lazily so the app can start before reportlab is loaded
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    return stringWidth(text, font_name, font_size)
+
+
+@lru_cache(maxsize=2)
+def _format_datetime(epoch_second: int) -> str:
+    """
+    Format the overlay timestamp for a given whole second.
+
+    Cached per second so every overlay created within the same second
+    (all pages of a batch, typically) shares one strftime call and one
+    string, which also keeps the overlay-render cache hitting.
+
+    Args:
+        epoch_second: Unix timestamp truncated to whole seconds
+
+    Returns:
+        Timestamp formatted as "YYYY-MM-DD HH:MM:SS"
+    """
+    return datetime.fromtimestamp(epoch_second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _current_datetime_text() -> str:
+    """Get the formatted timestamp for the current second."""
+    return _format_datetime(int(time.time()))
+
+
+def _escape_pdf_text(text: str) -> str:
+    """Escape backslashes and parentheses for a PDF literal string."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _render_overlay_template(
+    text: str, datetime_text: str, page_width: float, page_height: float
+) -> bytes:
+    """
+    Build the overlay PDF bytes directly from a minimal PDF skeleton.
+
+    The overlay only ever contains two Helvetica text runs, so the whole
+    document (catalog, page tree, font dict, content stream, xref table)
+    can be emitted as bytes without constructing a reportlab Canvas.
+
+    Args:
+        text: The hospital number text for the top-right corner
+        datetime_text: Formatted date/time string for the bottom-left corner
+        page_width: Width of the page in points
+        page_height: Height of the page in points
+
+    Returns:
+        Raw PDF bytes for the single-page overlay
+
+    Raises:
+        UnicodeEncodeError: If the text cannot be encoded as Latin-1
+    """
+    font_size = OverlayCreator.FONT_SIZE
+
+    # Calculate text position (top-right corner)
+    # PDF coordinates have origin at bottom-left, so we need to adjust
+    text_width = _text_width(text, OverlayCreator.FONT_NAME, font_size)
+    x = page_width - text_width - OverlayCreator.MARGIN_RIGHT
+    y = page_height - OverlayCreator.MARGIN_TOP - font_size
+
+    # Date and time at bottom-left
+    x_datetime = OverlayCreator.MARGIN_LEFT
+    y_datetime = OverlayCreator.MARGIN_BOTTOM
+
+    content = (
+        f"BT /F1 {font_size} Tf {x:.2f} {y:.2f} Td "
+        f"({_escape_pdf_text(text)}) Tj ET\n"
+        f"BT /F1 {font_size} Tf {x_datetime:.2f} {y_datetime:.2f} Td "
+        f"({_escape_pdf_text(datetime_text)}) Tj ET"
+    ).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R "
+            f"/MediaBox [0 0 {page_width:.2f} {page_height:.2f}] "
+            f"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>"
+        ).encode("latin-1"),
+        f"<< /Type /Font /Subtype /Type1 /BaseFont /{OverlayCreator.FONT_NAME} >>".encode("latin-1"),
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+
+    # Serialize objects, recording the byte offset of each for the xref table
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref_offset)
+    )
+
+    return bytes(pdf)
+
+
+def _render_overlay_canvas(
+    text: str, datetime_text: str, page_width: float, page_height: float
+) -> bytes:
+    """
+    Render overlay PDF bytes with a reportlab Canvas.
+
+    Fallback path for text the byte template cannot encode.
+
+    Args:
+        text: The hospital number text for the top-right corner
+        datetime_text: Formatted date/time string for the bottom-left corner
+        page_width: Width of the page in points
+        page_height: Height of the page in points
+
+    Returns:
+        Raw PDF bytes for the single-page overlay
+    """
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+
+    # Create canvas with transparent background
+    c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
+
+    # Calculate text position (top-right corner)
+    # Canvas coordinates have origin at bottom-left, so we need to adjust
+    text_width = _text_width(text, OverlayCreator.FONT_NAME, OverlayCreator.FONT_SIZE)
+    x = page_width - text_width - OverlayCreator.MARGIN_RIGHT
+    y = page_height - OverlayCreator.MARGIN_TOP - OverlayCreator.FONT_SIZE
+
+    # Draw the hospital number text (top-right)
+    c.setFont(OverlayCreator.FONT_NAME, OverlayCreator.FONT_SIZE)
+    c.drawString(x, y, text)
+
+    # Add date and time to bottom-left
+    x_datetime = OverlayCreator.MARGIN_LEFT
+    y_datetime = OverlayCreator.MARGIN_BOTTOM
+    c.drawString(x_datetime, y_datetime, datetime_text)
+
+    # Save the canvas
+    c.save()
+
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _render_overlay(
+    text: str, datetime_text: str, page_width: float, page_height: float
+) -> bytes:
+    """
+    Render overlay PDF bytes for a given text, timestamp, and page size.
+
+    Uses the direct byte template, falling back to a reportlab Canvas for
+    text outside Latin-1. Cached so consecutive pages (and files) that
+    share the same overlay text, timestamp, and mediabox reuse the
+    rendered bytes.
+
+    Args:
+        text: The hospital number text for the top-right corner
+        datetime_text: Formatted date/time string for the bottom-left corner
+        page_width: Width of the page in points
+        page_height: Height of the page in points
+
+    Returns:
+        Raw PDF bytes for the single-page overlay
+    """
+    try:
+        return _render_overlay_template(text, datetime_text, page_width, page_height)
+    except UnicodeEncodeError:
+        return _render_overlay_canvas(text, datetime_text, page_width, page_height)
 
 
 class OverlayCreator:
@@ -20,9 +213,22 @@ class OverlayCreator:
     MARGIN_BOTTOM = 20  # Distance from bottom edge
     MARGIN_LEFT = 20  # Distance from left edge
 
+    @staticmethod
+    def current_datetime_text() -> str:
+        """
+        Get the date/time text an overlay created now would be stamped with.
+
+        Exposed so callers that cache overlays can key their caches on the
+        stamp and notice when it rolls over to the next second.
+
+        Returns:
+            Timestamp formatted as "YYYY-MM-DD HH:MM:SS"
+        """
+        return _current_datetime_text()
+
     @staticmethod
     def create_text_overlay(
-        text: str, page_width: float, page_height: float
+        text: str, page_width: float, page_height: float, datetime_text: str = None
     ) -> BytesIO:
         """
         Create a transparent PDF with text at top-right (hospital number) and bottom-left (date/time).
@@ -31,35 +237,37 @@ class OverlayCreator:
             text: The text to display at top-right (e.g., "CMC-12345")
             page_width: Width of the page in points
             page_height: Height of the page in points
+            datetime_text: Date/time string for the bottom-left corner;
+                defaults to the current second's stamp
 
         Returns:
             BytesIO containing the overlay PDF with hospital number at top-right
             and current date/time at bottom-left
         """
-        buffer = BytesIO()
-
-        # Create canvas with transparent background
-        c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
-
-        # Calculate text position (top-right corner)
-        # Canvas coordinates have origin at bottom-left, so we need to adjust
-        text_width = c.stringWidth(text, OverlayCreator.FONT_NAME, OverlayCreator.FONT_SIZE)
-        x = page_width - text_width - OverlayCreator.MARGIN_RIGHT
-        y = page_height - OverlayCreator.MARGIN_TOP - OverlayCreator.FONT_SIZE
+        if datetime_text is None:
+            datetime_text = _current_datetime_text()
+        return BytesIO(_render_overlay(text, datetime_text, page_width, page_height))
 
-        # Draw the hospital number text (top-right)
-        c.setFont(OverlayCreator.FONT_NAME, OverlayCreator.FONT_SIZE)
-        c.drawString(x, y, text)
+    @staticmethod
+    def create_text_overlays_batch(
+        texts: list, page_width: float, page_height: float
+    ) -> list:
+        """
+        Create overlays for several texts sharing one page size and timestamp.
 
-        # Add current date and time to bottom-left
-        datetime_text = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        x_datetime = OverlayCreator.MARGIN_LEFT
-        y_datetime = OverlayCreator.MARGIN_BOTTOM
-        c.drawString(x_datetime, y_datetime, datetime_text)
+        All overlays are stamped with the same date/time, so identical texts
+        collapse to a single render via the overlay cache.
 
-        # Save the canvas
-        c.save()
+        Args:
+            texts: List of overlay text strings
+            page_width: Width of the page in points
+            page_height: Height of the page in points
 
-        # Get the PDF bytes
-        buffer.seek(0)
-        return buffer
+        Returns:
+            List of BytesIO objects, one overlay PDF per text
+        """
+        datetime_text = _current_datetime_text()
+        return [
+            BytesIO(_render_overlay(text, datetime_text, page_width, page_height))
+            for text in texts
+        ]
@@ -1,12 +1,17 @@
 """PDF processing and hospital number overlay functionality."""
 
+import hashlib
+import logging
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
-from pypdf import PdfReader, PdfWriter
-
 from .overlay import OverlayCreator
 
+logger = logging.getLogger(__name__)
+
 
 class PDFProcessor:
     """Processes PDFs and adds hospital number overlay."""
@@ -20,6 +25,60 @@ class PDFProcessor:
         """
         self.pdf_dir = Path(pdf_dir)
 
+        # Parsed overlay pages shared across files in a run, keyed by
+        # (overlay_text, datetime_text, page_width, page_height). Guarded
+        # by a lock since process_multiple runs add_hospital_number from
+        # worker threads. The datetime stamp in the key keeps a later run
+        # from reusing an overlay rendered with an earlier timestamp; the
+        # cache is flushed whenever the stamp rolls over so stale seconds
+        # never accumulate on this session-lived instance.
+        self._overlay_page_cache = {}
+        self._overlay_cache_stamp = None
+        self._overlay_cache_lock = threading.Lock()
+
+    def _get_overlay_page(self, overlay_text: str, page_width: float, page_height: float):
+        """
+        Get a parsed overlay page for the given text and page size.
+
+        The parsed PageObject is cached on the instance so every page (and
+        every file in a batch) sharing the same overlay text, timestamp,
+        and mediabox reuses one pypdf parse instead of re-reading the
+        overlay bytes.
+
+        Args:
+            overlay_text: Formatted overlay text
+            page_width: Width of the page in points
+            page_height: Height of the page in points
+
+        Returns:
+            Parsed overlay PageObject ready for merge_page
+        """
+        # Imported lazily so the app can start before pypdf is loaded
+        from pypdf import PdfReader
+
+        datetime_text = OverlayCreator.current_datetime_text()
+        cache_key = (
+            overlay_text, datetime_text, round(page_width, 2), round(page_height, 2)
+        )
+
+        with self._overlay_cache_lock:
+            if datetime_text != self._overlay_cache_stamp:
+                self._overlay_page_cache.clear()
+                self._overlay_cache_stamp = datetime_text
+
+            overlay_page = self._overlay_page_cache.get(cache_key)
+            if overlay_page is None:
+                overlay_buffer = OverlayCreator.create_text_overlay(
+                    overlay_text, page_width, page_height, datetime_text
+                )
+                overlay_page = PdfReader(overlay_buffer).pages[0]
+                # Force content-stream resolution now so later merge_page
+                # calls from other threads only read fully-parsed objects
+                overlay_page.get_contents()
+                self._overlay_page_cache[cache_key] = overlay_page
+
+        return overlay_page
+
     def add_hospital_number(
         self, pdf_filename: str, hospital_number: str, center_code: str, time_point: str
     ) -> BytesIO:
@@ -39,6 +98,8 @@ class PDFProcessor:
             FileNotFoundError: If PDF file not found
             Exception: If PDF is corrupted or cannot be processed
         """
+        from pypdf import PdfReader, PdfWriter
+
         pdf_path = self.pdf_dir / pdf_filename
 
         if not pdf_path.exists():
@@ -47,9 +108,12 @@ class PDFProcessor:
         # Format the overlay text with time point
         overlay_text = f"{time_point}-{center_code}-{hospital_number}"
 
-        # Read the original PDF
-        with open(pdf_path, "rb") as f:
-            reader = PdfReader(f)
+        # Memory-map the original PDF so pypdf reads pages straight from the
+        # OS page cache instead of copying the whole file through Python I/O
+        with open(pdf_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            reader = PdfReader(mm)
             writer = PdfWriter()
 
             # Check if PDF is encrypted
@@ -62,25 +126,22 @@ class PDFProcessor:
                 page_width = float(page.mediabox.width)
                 page_height = float(page.mediabox.height)
 
-                # Create overlay PDF
-                overlay_buffer = OverlayCreator.create_text_overlay(
+                # Look up the shared parsed overlay page for this size
+                overlay_page = self._get_overlay_page(
                     overlay_text, page_width, page_height
                 )
 
-                # Read overlay as PDF
-                overlay_pdf = PdfReader(overlay_buffer)
-                overlay_page = overlay_pdf.pages[0]
-
                 # Merge overlay onto original page
                 page.merge_page(overlay_page)
 
                 # Add modified page to writer
                 writer.add_page(page)
 
-        # Write to BytesIO buffer
-        output_buffer = BytesIO()
-        writer.write(output_buffer)
-        output_buffer.seek(0)
+            # Write to BytesIO buffer (while the mapping is still open, since
+            # pypdf resolves page objects lazily)
+            output_buffer = BytesIO()
+            writer.write(output_buffer)
+            output_buffer.seek(0)
 
         return output_buffer
 
@@ -102,40 +163,99 @@ class PDFProcessor:
         """
         results = {}
 
-        for filename in pdf_filenames:
-            try:
-                results[filename] = self.add_hospital_number(
-                    filename, hospital_number, center_code, time_point
+        if not pdf_filenames:
+            return results
+
+        # Each PDF is independent, so process them in parallel threads
+        max_workers = min(4, len(pdf_filenames))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                filename: executor.submit(
+                    self.add_hospital_number,
+                    filename,
+                    hospital_number,
+                    center_code,
+                    time_point,
                 )
-            except Exception as e:
-                # Store error information
-                results[filename] = None
-                print(f"Error processing {filename}: {str(e)}")
+                for filename in pdf_filenames
+            }
+
+            # Collect results in the original filename order
+            for filename, future in futures.items():
+                try:
+                    results[filename] = future.result()
+                except Exception as e:
+                    # Store error information
+                    results[filename] = None
+                    logger.error("Error processing %s: %s", filename, e)
 
         return results
 
-    def merge_pdfs(self, pdf_buffers: list) -> BytesIO:
+    @staticmethod
+    def write_buffer(output_path: Path, pdf_buffer: BytesIO) -> bool:
+        """
+        Write a PDF buffer to disk, skipping byte-identical rewrites.
+
+        When the destination already holds exactly these bytes (e.g. the
+        same download repeated within the overlay timestamp's second), the
+        write is skipped so the file is not churned on disk.
+
+        Args:
+            output_path: Destination file path
+            pdf_buffer: BytesIO containing the PDF to write
+
+        Returns:
+            True if the file was written, False if it was already identical
+        """
+        data = pdf_buffer.getbuffer()
+
+        try:
+            if output_path.stat().st_size == len(data):
+                new_hash = hashlib.sha256(data).digest()
+                with open(output_path, "rb") as f:
+                    old_hash = hashlib.file_digest(f, "sha256").digest()
+                if old_hash == new_hash:
+                    return False
+        except OSError:
+            pass
+
+        with open(output_path, "wb") as f:
+            f.write(data)
+        return True
+
+    def merge_pdfs(self, pdf_buffers) -> BytesIO:
         """
         Merge multiple PDF buffers into a single PDF.
 
+        Accepts any iterable, so callers can feed buffers in from a
+        generator and let each one become unreachable as soon as it has
+        been appended instead of holding a full list alive alongside the
+        growing merge output.
+
         Args:
-            pdf_buffers: List of BytesIO objects containing PDFs
+            pdf_buffers: Iterable of BytesIO objects containing PDFs
 
         Returns:
             BytesIO object containing merged PDF
         """
+        from pypdf import PdfWriter
+
         merger = PdfWriter()
 
         for pdf_buffer in pdf_buffers:
             try:
                 pdf_buffer.seek(0)
-                reader = PdfReader(pdf_buffer)
-                for page in reader.pages:
-                    merger.add_page(page)
+                # append clones the whole document in one pass, which is much
+                # faster than copying page objects one at a time
+                merger.append(pdf_buffer)
             except Exception as e:
-                print(f"Error merging PDF: {str(e)}")
+                logger.error("Error merging PDF: %s", e)
                 continue
 
+        # Deduplicate objects shared by the merged documents (fonts, the
+        # repeated overlay content) so the output is written once, smaller
+        merger.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
         # Write merged PDF to buffer
         output_buffer = BytesIO()
         merger.write(output_buffer)
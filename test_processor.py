@@ -0,0 +1,64 @@
+"""Test script for PDF processor functionality."""
+
+from pathlib import Path
+
+from pypdf import PdfReader
+
+from pdf.processor import PDFProcessor
+
+
+def test_processor():
+    """Test the PDF processor functionality against the bundled PDFs."""
+    files_dir = Path(__file__).parent / "files"
+    processor = PDFProcessor(files_dir)
+
+    pdf_files = sorted(p.name for p in files_dir.glob("*.pdf"))
+    assert pdf_files, "No PDFs found in files/ directory"
+
+    print("Testing PDF Processor...")
+    print("-" * 50)
+
+    # Test 1: Add hospital number to a single PDF
+    print("\nTest 1: Add hospital number overlay")
+    result = processor.add_hospital_number(pdf_files[0], "12345", "CMC", "A0")
+    assert len(result.getvalue()) > 0, "Modified PDF should not be empty"
+    reader = PdfReader(result)
+    assert len(reader.pages) > 0, "Modified PDF should have pages"
+    print(f"  [OK] Processed {pdf_files[0]} ({len(reader.pages)} page(s))")
+
+    # Test 2: Missing file raises FileNotFoundError
+    print("\nTest 2: Missing file")
+    try:
+        processor.add_hospital_number("does_not_exist.pdf", "12345", "CMC", "A0")
+        assert False, "Should have raised FileNotFoundError"
+    except FileNotFoundError:
+        print("  [OK] FileNotFoundError raised for missing file")
+
+    # Test 3: Process multiple PDFs
+    print("\nTest 3: Process multiple PDFs")
+    filenames = pdf_files[:3] + ["does_not_exist.pdf"]
+    results = processor.process_multiple(filenames, "12345", "CMC", "A0")
+    assert len(results) == len(filenames), "One result per filename expected"
+    assert results["does_not_exist.pdf"] is None, "Missing file should map to None"
+    for name in pdf_files[:3]:
+        assert results[name] is not None, f"{name} should process successfully"
+    print(f"  [OK] Processed {len(pdf_files[:3])} PDF(s), 1 expected failure")
+
+    # Test 4: Merge PDFs
+    print("\nTest 4: Merge PDFs")
+    buffers = [results[name] for name in pdf_files[:3]]
+    expected_pages = sum(len(PdfReader(b).pages) for b in buffers)
+    merged = processor.merge_pdfs(buffers)
+    merged_reader = PdfReader(merged)
+    assert len(merged_reader.pages) == expected_pages, (
+        f"Merged PDF should have {expected_pages} pages, got {len(merged_reader.pages)}"
+    )
+    print(f"  [OK] Merged {len(buffers)} PDF(s) into {expected_pages} page(s)")
+
+    print("\n" + "=" * 50)
+    print("All tests passed!")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    test_processor()
@@ -1,10 +1,14 @@
 """Main application window for Hospital PDF Manager."""
 
 import os
+import shutil
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 
-from PySide6.QtCore import Qt, QUrl, QTimer
+from PySide6.QtCore import Qt, QUrl, QElapsedTimer, QTimer, QRunnable, QThreadPool, QDir
 from PySide6.QtGui import QDesktopServices, QColor, QPalette
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -32,6 +36,68 @@ from utils.paths import get_files_dir
 from utils.operation_logger import OperationLogger
 
 
+def _open_short_lived(path):
+    """
+    Open a file for binary writing, hinted as short-lived where supported.
+
+    On Windows, O_SHORT_LIVED (FILE_ATTRIBUTE_TEMPORARY) tells the kernel
+    to keep the file's pages in memory and avoid eager writeback — a good
+    fit for print staging files the viewer reads back moments later.
+    Elsewhere this is an ordinary truncating open.
+
+    Args:
+        path: Destination file path
+
+    Returns:
+        Binary file object opened for writing
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if hasattr(os, "O_BINARY"):
+        flags |= os.O_BINARY
+    if hasattr(os, "O_SHORT_LIVED"):
+        flags |= os.O_SHORT_LIVED
+    return os.fdopen(os.open(str(path), flags), "wb")
+
+
+class _ProcessPdfTask(QRunnable):
+    """Runs one add_hospital_number call on a thread-pool worker."""
+
+    def __init__(self, processor, pdf_filename, hospital_number, center_code, time_point):
+        """
+        Initialize the task.
+
+        Args:
+            processor: PDFProcessor instance
+            pdf_filename: Name of the PDF file to process
+            hospital_number: Hospital number to add
+            center_code: Center code
+            time_point: Time point (A0/A1/A2)
+        """
+        super().__init__()
+        self.processor = processor
+        self.pdf_filename = pdf_filename
+        self.hospital_number = hospital_number
+        self.center_code = center_code
+        self.time_point = time_point
+        self.result = None
+        self.error = None
+        self.done = False
+
+    def run(self):
+        """Process the PDF, storing the result or error for the GUI thread."""
+        try:
+            self.result = self.processor.add_hospital_number(
+                self.pdf_filename,
+                self.hospital_number,
+                self.center_code,
+                self.time_point,
+            )
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+
+
 class MainWindow(QMainWindow):
     """Main application window for Hospital PDF Manager."""
 
@@ -42,6 +108,12 @@ class MainWindow(QMainWindow):
         ("LDH", "Ludhiana Hospital"),
     ]
 
+    # Assessment time points, in display order
+    TIMEPOINTS = ("A0", "A1", "A2")
+
+    # Static UI strings, interned once at class load
+    HOSPITAL_PLACEHOLDER = "Enter hospital number..."
+
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -52,10 +124,24 @@ class MainWindow(QMainWindow):
         self.pdf_dir = get_files_dir()
         self.processor = PDFProcessor(self.pdf_dir)
 
-        # Initialize operation logger
-        log_dir = Path(os.getenv("LOCALAPPDATA")) / "HospitalPDFManager"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        self.operation_logger = OperationLogger(log_dir / "operations.db")
+        # Operation logger is opened lazily on the first download/print,
+        # keeping the SQLite setup off the startup path
+        self._operation_logger = None
+
+        # Coalesces per-keystroke validation into one pass after typing
+        # pauses, so fast input does not restyle the window per character
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.update_button_states)
+
+        # Tracks the currently applied input styling so identical
+        # setStyleSheet calls (a full style re-parse in Qt) are skipped
+        self._input_invalid_state = None
+
+        # Print staging directory, resolved once; creation is retried per
+        # click only if something removed it in the meantime
+        self._print_temp_dir = Path(tempfile.gettempdir()) / "homerpdf_print"
 
         # Setup UI
         self.setup_ui()
@@ -66,6 +152,15 @@ class MainWindow(QMainWindow):
         # Center the window on screen
         self.center_window()
 
+    @property
+    def operation_logger(self) -> OperationLogger:
+        """Operation logger, opening its database on first use."""
+        if self._operation_logger is None:
+            log_dir = Path(os.getenv("LOCALAPPDATA")) / "HospitalPDFManager"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._operation_logger = OperationLogger(log_dir / "operations.db")
+        return self._operation_logger
+
     def center_window(self):
         """Center the window on the screen."""
         from PySide6.QtGui import QScreen
@@ -76,172 +171,224 @@ class MainWindow(QMainWindow):
         window_geometry.moveCenter(screen_geometry.center())
         self.move(window_geometry.topLeft())
 
+    # Generated stylesheets cached per palette cache key, shared by windows
+    _stylesheet_cache = {}
+    _error_qss_cache = {}
+
+    # Directory listings shared across window constructions, keyed by
+    # (directory, mtime) so an unchanged files/ folder is scanned once
+    _pdf_listing_cache = {}
+
+    # Compiled once at class load; apply_theme only substitutes colors
+    _STYLESHEET_TEMPLATE = Template("""
+        QGroupBox {
+            font-weight: bold;
+            border: 1px solid $border_color;
+            border-radius: 6px;
+            margin-top: 12px;
+            padding-top: 10px;
+            background-color: $group_bg;
+        }
+
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            left: 10px;
+            padding: 0 5px;
+            color: $text_color;
+        }
+
+        QLineEdit {
+            padding: 6px;
+            border: 1px solid $border_color;
+            border-radius: 4px;
+            background-color: $input_bg;
+            color: $text_color;
+        }
+
+        QLineEdit:focus {
+            border: 2px solid $highlight;
+            padding: 5px;
+        }
+
+        QComboBox {
+            padding: 6px;
+            border: 1px solid $border_color;
+            border-radius: 4px;
+            background-color: $input_bg;
+            color: $text_color;
+        }
+
+        QComboBox:focus {
+            border: 2px solid $highlight;
+        }
+
+        QComboBox::drop-down {
+            border: none;
+            padding-right: 5px;
+        }
+
+        QListWidget {
+            border: 1px solid $border_color;
+            border-radius: 4px;
+            padding: 4px;
+            background-color: $input_bg;
+            color: $text_color;
+        }
+
+        QListWidget::item {
+            padding: 4px;
+            border-radius: 3px;
+        }
+
+        QListWidget::item:hover {
+            background-color: $highlight_light;
+        }
+
+        QPushButton {
+            padding: 8px 16px;
+            border: 1px solid $border_color;
+            border-radius: 4px;
+            background-color: $button_bg;
+            color: $text_color;
+            font-weight: bold;
+        }
+
+        QPushButton:hover:!disabled {
+            background-color: $button_hover;
+            border: 2px solid $highlight;
+        }
+
+        QPushButton:pressed {
+            background-color: $highlight;
+        }
+
+        QPushButton:disabled {
+            background-color: $button_disabled_bg;
+            color: $button_disabled_text;
+            border: 1px solid $border_color;
+        }
+
+        QCheckBox {
+            spacing: 8px;
+            color: $text_color;
+        }
+
+        QCheckBox::indicator {
+            width: 18px;
+            height: 18px;
+            border: 1px solid $border_color;
+            border-radius: 3px;
+            background-color: $input_bg;
+        }
+
+        QCheckBox::indicator:checked {
+            background-color: $highlight;
+            border: 1px solid $highlight;
+        }
+
+        QRadioButton {
+            spacing: 8px;
+            color: $text_color;
+        }
+
+        QRadioButton::indicator {
+            width: 18px;
+            height: 18px;
+            border: 1px solid $border_color;
+            border-radius: 9px;
+            background-color: $input_bg;
+        }
+
+        QRadioButton::indicator:checked {
+            background-color: $highlight;
+            border: 3px solid $input_bg;
+        }
+
+        QLabel {
+            color: $text_color;
+        }
+
+        QStatusBar {
+            color: $text_color;
+            border-top: 1px solid $border_color;
+        }
+    """)
+
     def apply_theme(self):
         """Apply theme-aware styling that works in both light and dark mode."""
         # Get system palette colors
         palette = self.palette()
+
+        # Reuse the stylesheet generated for this palette, if any
+        palette_key = palette.cacheKey()
+        cached = self._stylesheet_cache.get(palette_key)
+        if cached is not None:
+            self.setStyleSheet(cached)
+            return
+
         is_dark = palette.color(QPalette.Window).lightness() < 128
 
         # Define colors based on theme
         if is_dark:
             # Dark mode colors
             group_bg = palette.color(QPalette.Window).lighter(110).name()
-            input_bg = palette.color(QPalette.Base).name()
-            text_color = palette.color(QPalette.Text).name()
-            border_color = palette.color(QPalette.Mid).name()
-            button_bg = palette.color(QPalette.Button).name()
             button_hover = palette.color(QPalette.Button).lighter(120).name()
-            button_disabled_bg = palette.color(QPalette.Window).name()
-            button_disabled_text = palette.color(QPalette.Mid).name()
         else:
             # Light mode colors
             group_bg = palette.color(QPalette.Window).darker(105).name()
-            input_bg = palette.color(QPalette.Base).name()
-            text_color = palette.color(QPalette.Text).name()
-            border_color = palette.color(QPalette.Mid).name()
-            button_bg = palette.color(QPalette.Button).name()
             button_hover = palette.color(QPalette.Button).darker(110).name()
-            button_disabled_bg = palette.color(QPalette.Window).name()
-            button_disabled_text = palette.color(QPalette.Mid).name()
-
-        # Apply comprehensive stylesheet
-        stylesheet = f"""
-            QGroupBox {{
-                font-weight: bold;
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 10px;
-                background-color: {group_bg};
-            }}
-
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 10px;
-                padding: 0 5px;
-                color: {text_color};
-            }}
-
-            QLineEdit {{
-                padding: 6px;
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                background-color: {input_bg};
-                color: {text_color};
-            }}
-
-            QLineEdit:focus {{
-                border: 2px solid {palette.color(QPalette.Highlight).name()};
-                padding: 5px;
-            }}
-
-            QComboBox {{
-                padding: 6px;
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                background-color: {input_bg};
-                color: {text_color};
-            }}
-
-            QComboBox:focus {{
-                border: 2px solid {palette.color(QPalette.Highlight).name()};
-            }}
-
-            QComboBox::drop-down {{
-                border: none;
-                padding-right: 5px;
-            }}
-
-            QListWidget {{
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                padding: 4px;
-                background-color: {input_bg};
-                color: {text_color};
-            }}
-
-            QListWidget::item {{
-                padding: 4px;
-                border-radius: 3px;
-            }}
-
-            QListWidget::item:hover {{
-                background-color: {palette.color(QPalette.Highlight).lighter(150).name()};
-            }}
-
-            QPushButton {{
-                padding: 8px 16px;
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                background-color: {button_bg};
-                color: {text_color};
-                font-weight: bold;
-            }}
-
-            QPushButton:hover:!disabled {{
-                background-color: {button_hover};
-                border: 2px solid {palette.color(QPalette.Highlight).name()};
-            }}
-
-            QPushButton:pressed {{
-                background-color: {palette.color(QPalette.Highlight).name()};
-            }}
-
-            QPushButton:disabled {{
-                background-color: {button_disabled_bg};
-                color: {button_disabled_text};
-                border: 1px solid {border_color};
-            }}
-
-            QCheckBox {{
-                spacing: 8px;
-                color: {text_color};
-            }}
-
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1px solid {border_color};
-                border-radius: 3px;
-                background-color: {input_bg};
-            }}
-
-            QCheckBox::indicator:checked {{
-                background-color: {palette.color(QPalette.Highlight).name()};
-                border: 1px solid {palette.color(QPalette.Highlight).name()};
-            }}
-
-            QRadioButton {{
-                spacing: 8px;
-                color: {text_color};
-            }}
-
-            QRadioButton::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1px solid {border_color};
-                border-radius: 9px;
-                background-color: {input_bg};
-            }}
-
-            QRadioButton::indicator:checked {{
-                background-color: {palette.color(QPalette.Highlight).name()};
-                border: 3px solid {input_bg};
-            }}
-
-            QLabel {{
-                color: {text_color};
-            }}
-
-            QStatusBar {{
-                color: {text_color};
-                border-top: 1px solid {border_color};
-            }}
-        """
 
+        # Fill in the precompiled template with this palette's colors
+        stylesheet = self._STYLESHEET_TEMPLATE.substitute(
+            group_bg=group_bg,
+            input_bg=palette.color(QPalette.Base).name(),
+            text_color=palette.color(QPalette.Text).name(),
+            border_color=palette.color(QPalette.Mid).name(),
+            button_bg=palette.color(QPalette.Button).name(),
+            button_hover=button_hover,
+            button_disabled_bg=palette.color(QPalette.Window).name(),
+            button_disabled_text=palette.color(QPalette.Mid).name(),
+            highlight=palette.color(QPalette.Highlight).name(),
+            highlight_light=palette.color(QPalette.Highlight).lighter(150).name(),
+        )
+
+        MainWindow._stylesheet_cache[palette_key] = stylesheet
         self.setStyleSheet(stylesheet)
 
+    def _list_pdfs(self) -> list:
+        """
+        List PDF filenames in the files directory, sorted by name.
+
+        The listing is cached at class level keyed by the directory's
+        mtime, so reopening the window on slow or networked drives skips
+        the readdir/stat pass unless the folder actually changed.
+
+        Returns:
+            Sorted list of PDF filenames
+        """
+        try:
+            cache_key = (str(self.pdf_dir), os.stat(self.pdf_dir).st_mtime_ns)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            cached = self._pdf_listing_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+        # QDir lists and sorts in one native pass, without building Path
+        # objects per file like glob does
+        pdf_names = list(
+            QDir(str(self.pdf_dir)).entryList(["*.pdf"], QDir.Files, QDir.Name)
+        )
+
+        if cache_key is not None:
+            # Keep only the latest listing; stale mtime keys are useless
+            MainWindow._pdf_listing_cache = {cache_key: pdf_names}
+
+        return list(pdf_names)
+
     def setup_ui(self):
         """Setup the UI components and layout."""
         # Create central widget
@@ -262,7 +409,7 @@ class MainWindow(QMainWindow):
         hospital_label = QLabel("Hospital Number:")
         hospital_label.setMinimumWidth(120)
         self.hospital_input = QLineEdit()
-        self.hospital_input.setPlaceholderText("Enter hospital number...")
+        self.hospital_input.setPlaceholderText(self.HOSPITAL_PLACEHOLDER)
         self.hospital_input.textChanged.connect(self.on_input_changed)
         hospital_layout.addWidget(hospital_label)
         hospital_layout.addWidget(self.hospital_input)
@@ -287,26 +434,23 @@ class MainWindow(QMainWindow):
         # Create button group for radio buttons (ensures only one can be selected)
         self.timepoint_group = QButtonGroup()
 
-        # Create radio buttons
-        self.radio_a0 = QRadioButton("A0")
-        self.radio_a1 = QRadioButton("A1")
-        self.radio_a2 = QRadioButton("A2")
-
-        # Add to button group
-        self.timepoint_group.addButton(self.radio_a0)
-        self.timepoint_group.addButton(self.radio_a1)
-        self.timepoint_group.addButton(self.radio_a2)
+        # Create radio buttons from the class-level time point tuple,
+        # mapping each button to its time point for direct lookup
+        self._timepoint_by_button = {}
+        for time_point in self.TIMEPOINTS:
+            radio = QRadioButton(time_point)
+            self.timepoint_group.addButton(radio)
+            self._timepoint_by_button[radio] = time_point
 
-        # Connect to validation
-        self.radio_a0.toggled.connect(self.on_input_changed)
-        self.radio_a1.toggled.connect(self.on_input_changed)
-        self.radio_a2.toggled.connect(self.on_input_changed)
+        # Single connection on the group; a selection change emits two
+        # toggled signals (old unchecked, new checked), so the slot only
+        # acts on the checked one
+        self.timepoint_group.buttonToggled.connect(self.on_timepoint_toggled)
 
         # Add to layout
         timepoint_layout.addWidget(timepoint_label)
-        timepoint_layout.addWidget(self.radio_a0)
-        timepoint_layout.addWidget(self.radio_a1)
-        timepoint_layout.addWidget(self.radio_a2)
+        for radio in self._timepoint_by_button:
+            timepoint_layout.addWidget(radio)
         timepoint_layout.addStretch()
 
         info_layout.addLayout(hospital_layout)
@@ -319,19 +463,35 @@ class MainWindow(QMainWindow):
         pdf_layout = QVBoxLayout()
 
         self.pdf_list = QListWidget()
+
+        # Live selection state kept in sync by itemChanged, so selection
+        # queries never have to walk the whole list widget
+        self._checked_pdfs = set()
+
         self.pdf_list.itemChanged.connect(self.on_selection_changed)
 
         # Populate PDF list
-        pdf_files = sorted(self.pdf_dir.glob("*.pdf"))
-        for pdf_file in pdf_files:
-            item = QListWidgetItem(pdf_file.stem.upper())
+        self._pdf_names = self._list_pdfs()
+        pdf_names = self._pdf_names
+
+        # Precompute the display labels, then populate with repaints and
+        # signals suspended so the widget lays out once instead of per
+        # item and itemChanged does not fire for every initial check state
+        display_names = [Path(pdf_name).stem.upper() for pdf_name in self._pdf_names]
+        self.pdf_list.setUpdatesEnabled(False)
+        self.pdf_list.blockSignals(True)
+        # Filenames are resolved from row index into self._pdf_names, so
+        # no per-item QVariant round-trips through setData are needed
+        for display_name in display_names:
+            item = QListWidgetItem(display_name)
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(Qt.Unchecked)
-            item.setData(Qt.UserRole, pdf_file.name)
             self.pdf_list.addItem(item)
 
-        if not pdf_files:
+        if not pdf_names:
             self.pdf_list.addItem("No PDFs found in files/ directory")
+        self.pdf_list.blockSignals(False)
+        self.pdf_list.setUpdatesEnabled(True)
 
         pdf_layout.addWidget(self.pdf_list)
         pdf_group.setLayout(pdf_layout)
@@ -366,34 +526,6 @@ class MainWindow(QMainWindow):
         # Setup status bar
         self.statusBar().showMessage("Ready")
 
-    def validate_inputs(self) -> bool:
-        """
-        Validate hospital number, time point selection, and PDF selection.
-
-        Returns:
-            True if validation passes, False otherwise
-        """
-        # Validate hospital number
-        hospital_number = self.hospital_input.text().strip()
-        is_valid, error_msg = validate_hospital_number(hospital_number)
-
-        if not is_valid:
-            self.set_input_invalid(True)
-            return False
-
-        # Validate time point selection (mandatory)
-        time_point = self.get_selected_timepoint()
-        if not time_point:
-            return False
-
-        # Check if any PDFs are selected
-        selected_pdfs = self.get_selected_pdfs()
-        if not selected_pdfs:
-            return False
-
-        self.set_input_invalid(False)
-        return True
-
     def set_input_invalid(self, is_invalid: bool):
         """
         Set visual feedback for invalid input.
@@ -401,19 +533,29 @@ class MainWindow(QMainWindow):
         Args:
             is_invalid: True if input is invalid
         """
+        # Re-applying an identical stylesheet still re-parses the CSS and
+        # invalidates the widget's style cache, so skip unchanged states
+        if is_invalid == self._input_invalid_state:
+            return
+        self._input_invalid_state = is_invalid
+
         if is_invalid:
-            # Get theme-aware error color
             palette = self.palette()
-            is_dark = palette.color(QPalette.Window).lightness() < 128
 
-            # Use a bright red that works in both modes
-            error_color = "#ff5555" if is_dark else "#dc3545"
-            bg_color = palette.color(QPalette.Base).name()
-            text_color = palette.color(QPalette.Text).name()
+            # Reuse the error stylesheet generated for this palette, so
+            # repeated keystrokes on invalid input do no string work
+            palette_key = palette.cacheKey()
+            error_qss = self._error_qss_cache.get(palette_key)
+            if error_qss is None:
+                is_dark = palette.color(QPalette.Window).lightness() < 128
+
+                # Use a bright red that works in both modes
+                error_color = "#ff5555" if is_dark else "#dc3545"
+                bg_color = palette.color(QPalette.Base).name()
+                text_color = palette.color(QPalette.Text).name()
 
-            # Add red border to input field with theme-aware colors
-            self.hospital_input.setStyleSheet(
-                f"""
+                # Red border on the input field with theme-aware colors
+                error_qss = f"""
                 QLineEdit {{
                     border: 2px solid {error_color};
                     border-radius: 4px;
@@ -422,33 +564,56 @@ class MainWindow(QMainWindow):
                     color: {text_color};
                 }}
                 """
-            )
+                MainWindow._error_qss_cache[palette_key] = error_qss
+
+            self.hospital_input.setStyleSheet(error_qss)
         else:
             # Reset to default styling (empty string lets main stylesheet take over)
             self.hospital_input.setStyleSheet("")
 
     def on_input_changed(self):
         """Handle changes to hospital number or center selection."""
-        self.update_button_states()
+        # Restarting the single-shot timer debounces bursts of keystrokes
+        # into one validation pass once the user pauses
+        self._validate_timer.start()
+
+    def on_timepoint_toggled(self, button, checked: bool):
+        """Handle time point radio changes, once per selection change."""
+        if checked:
+            self.update_button_states()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, item=None):
         """Handle changes to PDF selection."""
+        if item is not None:
+            # Rows map one-to-one onto self._pdf_names; the guard skips
+            # the placeholder item shown when the folder is empty
+            row = self.pdf_list.row(item)
+            if 0 <= row < len(self._pdf_names):
+                pdf_filename = self._pdf_names[row]
+                if item.checkState() == Qt.Checked:
+                    self._checked_pdfs.add(pdf_filename)
+                else:
+                    self._checked_pdfs.discard(pdf_filename)
         self.update_button_states()
 
     def update_button_states(self):
         """Update button enabled/disabled states based on validation."""
-        is_valid = self.validate_inputs()
+        # Validate the hospital number once and reuse the result for both
+        # the input styling and the button states
+        hospital_number = self.hospital_input.text().strip()
+        is_valid_number, _ = validate_hospital_number(hospital_number)
+
+        # Red border only for non-empty invalid input
+        self.set_input_invalid(bool(hospital_number) and not is_valid_number)
+
+        is_valid = (
+            is_valid_number
+            and bool(self.get_selected_timepoint())
+            and bool(self._checked_pdfs)
+        )
         self.download_btn.setEnabled(is_valid)
         self.print_btn.setEnabled(is_valid)
 
-        # Update input styling
-        hospital_number = self.hospital_input.text().strip()
-        if hospital_number:
-            is_valid_number, _ = validate_hospital_number(hospital_number)
-            self.set_input_invalid(not is_valid_number)
-        else:
-            self.set_input_invalid(False)
-
     def get_selected_pdfs(self) -> list:
         """
         Get list of selected PDF filenames.
@@ -456,14 +621,9 @@ class MainWindow(QMainWindow):
         Returns:
             List of selected PDF filenames
         """
-        selected = []
-        for i in range(self.pdf_list.count()):
-            item = self.pdf_list.item(i)
-            if item.checkState() == Qt.Checked:
-                pdf_filename = item.data(Qt.UserRole)
-                if pdf_filename:
-                    selected.append(pdf_filename)
-        return selected
+        # Filter the row-ordered name list against the live checked set,
+        # avoiding per-item widget calls
+        return [name for name in self._pdf_names if name in self._checked_pdfs]
 
     def get_selected_timepoint(self) -> str:
         """
@@ -472,40 +632,109 @@ class MainWindow(QMainWindow):
         Returns:
             Selected time point string or empty string if none selected
         """
-        if self.radio_a0.isChecked():
-            return "A0"
-        elif self.radio_a1.isChecked():
-            return "A1"
-        elif self.radio_a2.isChecked():
-            return "A2"
-        return ""
+        return self._timepoint_by_button.get(self.timepoint_group.checkedButton(), "")
 
-    def on_download_clicked(self):
-        """Handle download button click."""
-        # Get save directory from user
-        save_dir = QFileDialog.getExistingDirectory(
-            self, "Select Download Location", str(Path.home())
-        )
+    def _start_processing_tasks(
+        self, selected_pdfs: list, hospital_number: str, center_code: str, time_point: str
+    ) -> list:
+        """
+        Start one processing task per selected PDF on the global thread pool.
 
-        if not save_dir:
-            return  # User cancelled
+        Args:
+            selected_pdfs: List of PDF filenames to process
+            hospital_number: Hospital number to add
+            center_code: Center code
+            time_point: Time point (A0/A1/A2)
 
-        save_dir = Path(save_dir)
+        Returns:
+            List of started _ProcessPdfTask objects, in selection order
+        """
+        pool = QThreadPool.globalInstance()
+        tasks = []
+        for pdf_filename in selected_pdfs:
+            task = _ProcessPdfTask(
+                self.processor, pdf_filename, hospital_number, center_code, time_point
+            )
+            tasks.append(task)
+            pool.start(task)
+        return tasks
 
-        # Get inputs
+    def _wait_for_tasks(self, tasks: list, progress):
+        """
+        Wait for processing tasks while keeping the progress dialog live.
+
+        Args:
+            tasks: List of _ProcessPdfTask objects
+            progress: QProgressDialog to update with completed counts
+        """
+        # Draining the event queue every poll iteration processes paint and
+        # timer events far faster than anyone can see; pump at ~60 Hz instead
+        pump_interval_ms = 16
+        timer = QElapsedTimer()
+        timer.start()
+        last_pump = -pump_interval_ms
+
+        while True:
+            completed = sum(task.done for task in tasks)
+            if completed == len(tasks):
+                progress.setValue(completed)
+                break
+            if timer.elapsed() - last_pump >= pump_interval_ms:
+                last_pump = timer.elapsed()
+                progress.setValue(completed)
+                QApplication.processEvents()
+            time.sleep(0.005)
+
+    def _collect_operation_inputs(self, operation_type: str):
+        """
+        Gather validated inputs for a download/print operation.
+
+        Checks the operation log for duplicates and, if needed, prompts
+        the user for a reprint reason.
+
+        Args:
+            operation_type: Operation type ("download" or "print")
+
+        Returns:
+            Tuple of (hospital_number, center_code, time_point,
+            selected_pdfs, merge_pdfs, duplicate_info, reprint_reason,
+            operation_hash), or None if validation fails or the user
+            cancelled
+        """
         hospital_number = self.hospital_input.text().strip()
         center_code = self.center_combo.currentData()
         time_point = self.get_selected_timepoint()
         selected_pdfs = self.get_selected_pdfs()
         merge_pdfs = self.merge_checkbox.isChecked()
 
+        # The debounced button-state update can lag the input by up to
+        # 150 ms, so a click in that window may arrive with a stale
+        # enabled button — revalidate everything at click time
+        is_valid_number, error_msg = validate_hospital_number(hospital_number)
+        if not is_valid_number:
+            QMessageBox.warning(self, "Invalid Hospital Number", error_msg)
+            return None
+
+        if not time_point:
+            QMessageBox.warning(
+                self, "No Time Point", "Please select a time point (A0, A1, or A2)"
+            )
+            return None
+
         if not selected_pdfs:
             QMessageBox.warning(self, "No Selection", "Please select at least one PDF")
-            return
+            return None
+
+        # Hash the operation once and share it with the duplicate check
+        # and the later log_operation call
+        operation_hash = OperationLogger.calculate_operation_hash(
+            time_point, center_code, hospital_number, selected_pdfs, operation_type, merge_pdfs
+        )
 
         # Check for duplicate operation
         duplicate_info = self.operation_logger.check_duplicate(
-            time_point, center_code, hospital_number, selected_pdfs, "download", merge_pdfs
+            time_point, center_code, hospital_number, selected_pdfs, operation_type, merge_pdfs,
+            operation_hash=operation_hash,
         )
 
         reprint_reason = None
@@ -513,66 +742,126 @@ class MainWindow(QMainWindow):
             # Show reason dialog
             from ui.reprint_dialog import ReprintReasonDialog
 
-            dialog = ReprintReasonDialog(self, "download", duplicate_info)
-            reprint_reason = dialog.get_reason()
+            reprint_reason = ReprintReasonDialog.prompt(
+                self, operation_type, duplicate_info
+            )
 
             if reprint_reason is None:
                 # User cancelled
-                self.statusBar().showMessage("Download cancelled by user")
-                return
-
-        # Create progress dialog
-        progress = QProgressDialog(
-            "Downloading PDFs...", None, 0, len(selected_pdfs), self
+                self.statusBar().showMessage(
+                    f"{operation_type.title()} cancelled by user"
+                )
+                return None
+
+        return (
+            hospital_number,
+            center_code,
+            time_point,
+            selected_pdfs,
+            merge_pdfs,
+            duplicate_info,
+            reprint_reason,
+            operation_hash,
         )
+
+    def _process_selected_pdfs(
+        self,
+        selected_pdfs: list,
+        hospital_number: str,
+        center_code: str,
+        time_point: str,
+        progress_label: str,
+    ):
+        """
+        Process the selected PDFs on the thread pool with a progress dialog.
+
+        Args:
+            selected_pdfs: List of PDF filenames to process
+            hospital_number: Hospital number to add
+            center_code: Center code
+            time_point: Time point (A0/A1/A2)
+            progress_label: Label text for the progress dialog
+
+        Returns:
+            Tuple of (processed_pdfs, successful, failed, errors) where
+            processed_pdfs is a list of (filename, BytesIO) pairs
+        """
+        progress = QProgressDialog(progress_label, None, 0, len(selected_pdfs), self)
         progress.setWindowModality(Qt.WindowModal)
         progress.setAutoClose(False)
         progress.show()
 
-        # Process each PDF
+        # Process each PDF on the thread pool so the GUI stays responsive
+        tasks = self._start_processing_tasks(
+            selected_pdfs, hospital_number, center_code, time_point
+        )
+        self._wait_for_tasks(tasks, progress)
+
         successful = 0
         failed = 0
         errors = []
         processed_pdfs = []
 
-        for idx, pdf_filename in enumerate(selected_pdfs):
-            progress.setValue(idx)
-            QApplication.processEvents()  # Update UI
-
-            try:
-                # Process PDF
-                modified_pdf = self.processor.add_hospital_number(
-                    pdf_filename, hospital_number, center_code, time_point
-                )
-                processed_pdfs.append((pdf_filename, modified_pdf))
+        for task in tasks:
+            if task.error is None:
+                processed_pdfs.append((task.pdf_filename, task.result))
                 successful += 1
-
-            except FileNotFoundError as e:
+            elif isinstance(task.error, FileNotFoundError):
                 failed += 1
-                errors.append(f"{pdf_filename}: File not found")
-            except ValueError as e:
-                failed += 1
-                errors.append(f"{pdf_filename}: {str(e)}")
-            except Exception as e:
+                errors.append(f"{task.pdf_filename}: File not found")
+            else:
                 failed += 1
-                errors.append(f"{pdf_filename}: {str(e)}")
+                errors.append(f"{task.pdf_filename}: {str(task.error)}")
 
         progress.close()
+        return processed_pdfs, successful, failed, errors
+
+    def on_download_clicked(self):
+        """Handle download button click."""
+        # Get save directory from user
+        save_dir = QFileDialog.getExistingDirectory(
+            self, "Select Download Location", str(Path.home())
+        )
+
+        if not save_dir:
+            return  # User cancelled
+
+        save_dir = Path(save_dir)
+
+        inputs = self._collect_operation_inputs("download")
+        if inputs is None:
+            return
+        (
+            hospital_number,
+            center_code,
+            time_point,
+            selected_pdfs,
+            merge_pdfs,
+            duplicate_info,
+            reprint_reason,
+            operation_hash,
+        ) = inputs
+
+        processed_pdfs, successful, failed, errors = self._process_selected_pdfs(
+            selected_pdfs, hospital_number, center_code, time_point, "Downloading PDFs..."
+        )
 
         # Save PDFs
         if merge_pdfs and len(processed_pdfs) > 0:
             # Merge all PDFs into one
             try:
-                pdf_buffers = [pdf for _, pdf in processed_pdfs]
-                merged_pdf = self.processor.merge_pdfs(pdf_buffers)
+                # Feed buffers in as a generator so each is released to
+                # the GC right after it is appended to the merge
+                merged_pdf = self.processor.merge_pdfs(
+                    pdf for _, pdf in processed_pdfs
+                )
 
                 # Create output filename
                 output_filename = f"{hospital_number}_merged.pdf"
                 output_path = save_dir / output_filename
 
-                # Save to file
-                with open(output_path, "wb") as f:
-                    f.write(merged_pdf.getvalue())
+                # Save to file (skips the write if an identical copy exists)
+                self.processor.write_buffer(output_path, merged_pdf)
 
                 message = f"Downloaded merged PDF to:\n{save_dir}\n\nFile: {output_filename}"
                 QMessageBox.information(self, "Success", message)
@@ -588,6 +877,7 @@ class MainWindow(QMainWindow):
                     merge_pdfs,
                     is_duplicate=(duplicate_info is not None),
                     reprint_reason=reprint_reason,
+                    operation_hash=operation_hash,
                     output_path=str(save_dir),
                 )
 
@@ -596,31 +886,38 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Merge Failed", error_msg)
                 self.statusBar().showMessage("Merge failed")
         else:
-            # Save individual PDFs
-            for pdf_filename, modified_pdf in processed_pdfs:
-                try:
-                    # Create output filename
-                    output_filename = f"{hospital_number}_{Path(pdf_filename).stem}.pdf"
-                    output_path = save_dir / output_filename
-
-                    # Save to file
-                    with open(output_path, "wb") as f:
-                        f.write(modified_pdf.getvalue())
-
-                except PermissionError:
-                    failed += 1
-                    errors.append(f"{output_filename}: Permission denied (check folder permissions)")
-                except Exception as e:
-                    failed += 1
-                    errors.append(f"{pdf_filename}: {str(e)}")
+            # Save individual PDFs in parallel; each write is independent
+            if processed_pdfs:
+                with ThreadPoolExecutor(max_workers=min(4, len(processed_pdfs))) as executor:
+                    writes = []
+                    for pdf_filename, modified_pdf in processed_pdfs:
+                        # Create output filename
+                        output_filename = f"{hospital_number}_{Path(pdf_filename).stem}.pdf"
+                        output_path = save_dir / output_filename
+
+                        # Save to file (skips the write if an identical copy exists)
+                        future = executor.submit(
+                            self.processor.write_buffer, output_path, modified_pdf
+                        )
+                        writes.append((pdf_filename, output_filename, future))
+
+                    for pdf_filename, output_filename, future in writes:
+                        try:
+                            future.result()
+                        except PermissionError:
+                            failed += 1
+                            errors.append(f"{output_filename}: Permission denied (check folder permissions)")
+                        except Exception as e:
+                            failed += 1
+                            errors.append(f"{pdf_filename}: {str(e)}")
 
             # Show results
             if successful > 0:
                 message = f"Downloaded {successful} PDF(s) to:\n{save_dir}"
                 if failed > 0:
-                    message += f"\n\nFailed: {failed} PDF(s)"
-                    for error in errors:
-                        message += f"\n  • {error}"
+                    message += f"\n\nFailed: {failed} PDF(s)" + "".join(
+                        f"\n  • {error}" for error in errors
+                    )
                     QMessageBox.warning(self, "Partial Success", message)
                 else:
                     QMessageBox.information(self, "Success", message)
@@ -635,102 +932,96 @@ class MainWindow(QMainWindow):
                     merge_pdfs,
                     is_duplicate=(duplicate_info is not None),
                     reprint_reason=reprint_reason,
+                    operation_hash=operation_hash,
                     output_path=str(save_dir),
                 )
             else:
-                error_msg = "Failed to download PDFs:\n"
-                for error in errors:
-                    error_msg += f"  • {error}\n"
+                error_msg = "Failed to download PDFs:\n" + "".join(
+                    f"  • {error}\n" for error in errors
+                )
                 QMessageBox.critical(self, "Download Failed", error_msg)
 
             self.statusBar().showMessage(f"Downloaded {successful} PDF(s)")
 
-    def on_print_clicked(self):
-        """Handle print button click."""
-        # Get inputs
-        hospital_number = self.hospital_input.text().strip()
-        center_code = self.center_combo.currentData()
-        time_point = self.get_selected_timepoint()
-        selected_pdfs = self.get_selected_pdfs()
-        merge_pdfs = self.merge_checkbox.isChecked()
-
-        if not selected_pdfs:
-            QMessageBox.warning(self, "No Selection", "Please select at least one PDF")
-            return
-
-        # Check for duplicate operation
-        duplicate_info = self.operation_logger.check_duplicate(
-            time_point, center_code, hospital_number, selected_pdfs, "print", merge_pdfs
-        )
-
-        reprint_reason = None
-        if duplicate_info:
-            # Show reason dialog
-            from ui.reprint_dialog import ReprintReasonDialog
+    @staticmethod
+    def _clean_print_staging(staging_root: Path):
+        """
+        Remove staged files left behind by earlier print runs.
 
-            dialog = ReprintReasonDialog(self, "print", duplicate_info)
-            reprint_reason = dialog.get_reason()
+        Best effort: a PDF still open in the user's viewer keeps its file
+        locked on Windows, so failures are ignored and retried on the
+        next print.
 
-            if reprint_reason is None:
-                # User cancelled
-                self.statusBar().showMessage("Print cancelled by user")
-                return
+        Args:
+            staging_root: The shared print staging directory
+        """
+        for entry in staging_root.iterdir():
+            try:
+                if entry.is_dir():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink()
+            except OSError:
+                pass
 
-        # Create temp directory
+    def on_print_clicked(self):
+        """Handle print button click."""
+        inputs = self._collect_operation_inputs("print")
+        if inputs is None:
+            return
+        (
+            hospital_number,
+            center_code,
+            time_point,
+            selected_pdfs,
+            merge_pdfs,
+            duplicate_info,
+            reprint_reason,
+            operation_hash,
+        ) = inputs
+
+        # Stage this run into its own fresh subdirectory so the folder we
+        # may open for the user only ever contains this operation's files,
+        # never staged PDFs from earlier prints or other patients. Old
+        # run directories are swept out first (best effort).
         try:
-            temp_dir = Path(tempfile.gettempdir()) / "homerpdf_print"
-            temp_dir.mkdir(exist_ok=True)
+            staging_root = self._print_temp_dir
+            staging_root.mkdir(exist_ok=True)
+            self._clean_print_staging(staging_root)
+            run_dir = Path(tempfile.mkdtemp(prefix="print_", dir=staging_root))
         except Exception as e:
             QMessageBox.critical(
                 self, "System Error", f"Cannot create temporary directory: {str(e)}"
             )
             return
 
-        # Create progress dialog
-        progress = QProgressDialog(
-            "Preparing PDFs for printing...", None, 0, len(selected_pdfs), self
+        processed_pdfs, successful, failed, errors = self._process_selected_pdfs(
+            selected_pdfs,
+            hospital_number,
+            center_code,
+            time_point,
+            "Preparing PDFs for printing...",
         )
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setAutoClose(False)
-        progress.show()
-
-        # Process each PDF
-        successful = 0
-        failed = 0
-        errors = []
-        processed_pdfs = []
-
-        for idx, pdf_filename in enumerate(selected_pdfs):
-            progress.setValue(idx)
-            QApplication.processEvents()  # Update UI
-
-            try:
-                # Process PDF
-                modified_pdf = self.processor.add_hospital_number(
-                    pdf_filename, hospital_number, center_code, time_point
-                )
-                processed_pdfs.append((pdf_filename, modified_pdf))
-                successful += 1
-
-            except Exception as e:
-                failed += 1
-                errors.append(f"{pdf_filename}: {str(e)}")
-
-        progress.close()
 
         # Open PDFs
         if merge_pdfs and len(processed_pdfs) > 0:
             # Merge all PDFs and open as one
             try:
-                pdf_buffers = [pdf for _, pdf in processed_pdfs]
-                merged_pdf = self.processor.merge_pdfs(pdf_buffers)
+                # Feed buffers in as a generator so each is released to
+                # the GC right after it is appended to the merge
+                merged_pdf = self.processor.merge_pdfs(
+                    pdf for _, pdf in processed_pdfs
+                )
 
                 # Save to temp
                 temp_filename = f"{hospital_number}_merged.pdf"
-                temp_path = temp_dir / temp_filename
+                temp_path = run_dir / temp_filename
 
-                with open(temp_path, "wb") as f:
-                    f.write(merged_pdf.getvalue())
+                # Stream the merged PDF to disk in chunks; merged output can
+                # be large and this never materializes a second copy
+                merged_pdf.seek(0)
+                with _open_short_lived(temp_path) as f:
+                    shutil.copyfileobj(merged_pdf, f, length=1024 * 1024)
 
                 # Open with system viewer
                 QDesktopServices.openUrl(QUrl.fromLocalFile(str(temp_path)))
@@ -749,6 +1040,7 @@ class MainWindow(QMainWindow):
                     merge_pdfs,
                     is_duplicate=(duplicate_info is not None),
                     reprint_reason=reprint_reason,
+                    operation_hash=operation_hash,
                     output_path=None,  # Print uses temp directory
                 )
 
@@ -757,30 +1049,43 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Merge Failed", error_msg)
                 self.statusBar().showMessage("Merge failed")
         else:
-            # Open individual PDFs
+            # Write all individual PDFs to temp first
+            temp_paths = []
             for pdf_filename, modified_pdf in processed_pdfs:
                 try:
                     # Save to temp
                     temp_filename = f"{hospital_number}_{Path(pdf_filename).stem}.pdf"
-                    temp_path = temp_dir / temp_filename
-
-                    with open(temp_path, "wb") as f:
-                        f.write(modified_pdf.getvalue())
+                    temp_path = run_dir / temp_filename
 
-                    # Open with system viewer
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(str(temp_path)))
+                    with _open_short_lived(temp_path) as f:
+                        f.write(modified_pdf.getbuffer())
+                    temp_paths.append(temp_path)
 
                 except Exception as e:
                     failed += 1
                     errors.append(f"{pdf_filename}: {str(e)}")
 
+            # Launch the viewer once: a single PDF opens directly, several
+            # open this run's staging folder instead of spawning one
+            # viewer per file
+            if len(temp_paths) == 1:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(str(temp_paths[0])))
+            elif temp_paths:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(str(run_dir)))
+
             # Show results
             if successful > 0:
-                message = f"Opened {successful} PDF(s) in your default viewer for printing"
+                if len(temp_paths) == 1:
+                    message = "Opened 1 PDF in your default viewer for printing"
+                else:
+                    message = (
+                        f"Prepared {successful} PDF(s) for printing and opened "
+                        f"their folder:\n{run_dir}"
+                    )
                 if failed > 0:
-                    message += f"\n\nFailed: {failed} PDF(s)"
-                    for error in errors:
-                        message += f"\n  • {error}"
+                    message += f"\n\nFailed: {failed} PDF(s)" + "".join(
+                        f"\n  • {error}" for error in errors
+                    )
                     QMessageBox.warning(self, "Partial Success", message)
                 else:
                     QMessageBox.information(self, "Success", message)
@@ -795,12 +1100,13 @@ class MainWindow(QMainWindow):
                     merge_pdfs,
                     is_duplicate=(duplicate_info is not None),
                     reprint_reason=reprint_reason,
+                    operation_hash=operation_hash,
                     output_path=None,  # Print uses temp directory
                 )
             else:
-                error_msg = "Failed to prepare PDFs for printing:\n"
-                for error in errors:
-                    error_msg += f"  • {error}\n"
+                error_msg = "Failed to prepare PDFs for printing:\n" + "".join(
+                    f"  • {error}\n" for error in errors
+                )
                 QMessageBox.critical(self, "Print Failed", error_msg)
 
             self.statusBar().showMessage(f"Opened {successful} PDF(s) for printing")
@@ -1,29 +1,107 @@
 """Dialog for collecting reason for duplicate operations."""
 
 from datetime import datetime
+from functools import lru_cache
+from string import Template
 from typing import Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPalette
+from PySide6.QtGui import QPalette, QTextCursor
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
-    QHBoxLayout,
     QLabel,
     QComboBox,
     QTextEdit,
-    QPushButton,
     QGroupBox,
     QDialogButtonBox,
+    QMessageBox,
 )
 
 
+@lru_cache(maxsize=128)
+def _format_timestamp(iso_timestamp: str) -> str:
+    """
+    Format an ISO timestamp for display, cached per unique string.
+
+    Repeated prompts for the same previous operation skip the parse and
+    locale-aware strftime on cache hits.
+
+    Args:
+        iso_timestamp: Timestamp as stored in the operation log
+
+    Returns:
+        Human-readable timestamp, or the raw string if unparseable
+    """
+    try:
+        dt = datetime.fromisoformat(iso_timestamp)
+        return dt.strftime("%Y-%m-%d %I:%M:%S %p")
+    except (TypeError, ValueError):
+        return iso_timestamp
+
+
+# Dark-mode detection results per palette cacheKey; the lightness
+# computation clones a QColor and only changes when the palette does
+_is_dark_cache = {}
+
+
+def _is_dark_palette(palette) -> bool:
+    """
+    Check whether a palette is a dark theme, cached per palette.
+
+    Args:
+        palette: QPalette to inspect
+
+    Returns:
+        True if the palette's window color is dark
+    """
+    palette_key = palette.cacheKey()
+    is_dark = _is_dark_cache.get(palette_key)
+    if is_dark is None:
+        is_dark = palette.color(QPalette.Window).lightness() < 128
+        _is_dark_cache[palette_key] = is_dark
+    return is_dark
+
+
+# Compiled once at import; setup_ui only substitutes the values
+_DETAILS_TEMPLATE = Template("""
+<b>Date:</b> $timestamp<br>
+<b>Operation:</b> $operation<br>
+<b>Time Point:</b> $time_point<br>
+<b>Center:</b> $center<br>
+<b>Hospital Number:</b> $hospital_number<br>
+<b>PDF Files:</b> $pdf_files<br>
+<b>Merged:</b> $merged<br>
+""")
+
+
 class ReprintReasonDialog(QDialog):
     """Dialog for collecting reason for duplicate operation."""
 
     MIN_REASON_LENGTH = 10
     MAX_REASON_LENGTH = 500
 
+    # Counter label template, formatted once; only the count varies
+    COUNTER_FORMAT = (
+        f"%d / {MAX_REASON_LENGTH} characters "
+        f"(minimum {MIN_REASON_LENGTH} required)"
+    )
+
+    # Generated stylesheets shared across dialog instances, keyed by
+    # QPalette cacheKey so each theme is formatted once per process
+    _style_cache = {}
+
+    # Reused dialog instance; widget construction and stylesheet polish
+    # are paid once, later prompts only swap the dynamic content
+    _shared_instance = None
+
+    # Preset combo model shared by all instances, built on first use
+    # (item models need a live QApplication, so not at import time)
+    _preset_model = None
+
+    # The free-text preset; selecting it must not overwrite the input
+    OTHER_REASON = "Other (please specify)"
+
     PRESET_REASONS = [
         "Lost original file",
         "Damaged/corrupted print",
@@ -31,7 +109,7 @@ class ReprintReasonDialog(QDialog):
         "Patient record update",
         "File sent to wrong recipient",
         "Quality issue with previous print",
-        "Other (please specify)",
+        OTHER_REASON,
     ]
 
     def __init__(self, parent, operation_type: str, previous_operation: dict):
@@ -49,9 +127,15 @@ class ReprintReasonDialog(QDialog):
         self.previous_operation = previous_operation
         self.reason = None
 
+        # Guards against textChanged re-entering while truncating
+        self._truncating = False
+
+        # Last count shown in the counter label, to skip no-op setText
+        self._last_char_count = 0
+
         # Get theme colors
         self.palette = self.palette()
-        self.is_dark = self.palette.color(QPalette.Window).lightness() < 128
+        self.is_dark = _is_dark_palette(self.palette)
 
         self.setup_ui()
         self.apply_theme()
@@ -74,28 +158,7 @@ class ReprintReasonDialog(QDialog):
         details_group = QGroupBox("Previous Operation Details")
         details_layout = QVBoxLayout()
 
-        # Parse timestamp
-        try:
-            dt = datetime.fromisoformat(self.previous_operation["timestamp"])
-            timestamp_str = dt.strftime("%Y-%m-%d %I:%M:%S %p")
-        except Exception:
-            timestamp_str = self.previous_operation["timestamp"]
-
-        # Create details text
-        details_text = f"""
-<b>Date:</b> {timestamp_str}<br>
-<b>Operation:</b> {self.previous_operation['operation_type'].title()}<br>
-<b>Time Point:</b> {self.previous_operation['time_point']}<br>
-<b>Center:</b> {self.previous_operation['center_code']}<br>
-<b>Hospital Number:</b> {self.previous_operation['hospital_number']}<br>
-<b>PDF Files:</b> {', '.join(self.previous_operation['pdf_files'])}<br>
-<b>Merged:</b> {'Yes' if self.previous_operation['merge_flag'] else 'No'}<br>
-"""
-
-        if self.previous_operation.get("username"):
-            details_text += f"<b>User:</b> {self.previous_operation['username']}<br>"
-
-        self.details_label = QLabel(details_text)
+        self.details_label = QLabel(self._build_details_text())
         self.details_label.setWordWrap(True)
         details_layout.addWidget(self.details_label)
 
@@ -109,9 +172,7 @@ class ReprintReasonDialog(QDialog):
         # Preset reasons dropdown
         preset_label = QLabel("Select a reason:")
         self.preset_combo = QComboBox()
-        self.preset_combo.addItem("-- Select a preset reason --")
-        for reason in self.PRESET_REASONS:
-            self.preset_combo.addItem(reason)
+        self.preset_combo.setModel(self._preset_item_model())
         self.preset_combo.currentIndexChanged.connect(self.on_preset_selected)
 
         reason_layout.addWidget(preset_label)
@@ -130,72 +191,153 @@ class ReprintReasonDialog(QDialog):
         reason_layout.addWidget(self.reason_text)
 
         # Character counter
-        self.char_counter = QLabel("0 / 500 characters (minimum 10 required)")
+        self.char_counter = QLabel(self.COUNTER_FORMAT % 0)
         reason_layout.addWidget(self.char_counter)
 
         reason_group.setLayout(reason_layout)
         layout.addWidget(reason_group)
 
         # ===== Buttons =====
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-
-        self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.clicked.connect(self.reject)
-
-        self.continue_btn = QPushButton(f"Continue with {self.operation_type.title()}")
-        self.continue_btn.clicked.connect(self.accept_with_validation)
+        # QDialogButtonBox handles platform button ordering and routes
+        # the accept/reject signals natively
+        self.button_box = QDialogButtonBox()
+        self.cancel_btn = self.button_box.addButton(QDialogButtonBox.Cancel)
+        self.continue_btn = self.button_box.addButton(
+            f"Continue with {self.operation_type.title()}",
+            QDialogButtonBox.AcceptRole,
+        )
         self.continue_btn.setEnabled(False)
 
-        button_layout.addWidget(self.cancel_btn)
-        button_layout.addWidget(self.continue_btn)
+        self.button_box.accepted.connect(self.accept_with_validation)
+        self.button_box.rejected.connect(self.reject)
 
-        layout.addLayout(button_layout)
+        layout.addWidget(self.button_box)
 
         self.setLayout(layout)
 
-    def apply_theme(self):
-        """Apply theme-aware styling to dialog components."""
-        # Get system palette colors
+    @classmethod
+    def _preset_item_model(cls):
+        """
+        Get the shared item model backing the preset combo.
+
+        Returns:
+            QStandardItemModel with the placeholder and preset reasons
+        """
+        if cls._preset_model is None:
+            from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+            model = QStandardItemModel()
+            model.appendRow(QStandardItem("-- Select a preset reason --"))
+            for reason in cls.PRESET_REASONS:
+                model.appendRow(QStandardItem(reason))
+            cls._preset_model = model
+        return cls._preset_model
+
+    def _build_details_text(self) -> str:
+        """
+        Format the previous-operation details HTML.
+
+        Returns:
+            HTML string for the details label
+        """
+        # Create details text from the precompiled template
+        details_text = _DETAILS_TEMPLATE.substitute(
+            timestamp=_format_timestamp(self.previous_operation["timestamp"]),
+            operation=self.previous_operation["operation_type"].title(),
+            time_point=self.previous_operation["time_point"],
+            center=self.previous_operation["center_code"],
+            hospital_number=self.previous_operation["hospital_number"],
+            pdf_files=", ".join(map(str, self.previous_operation["pdf_files"])),
+            merged="Yes" if self.previous_operation["merge_flag"] else "No",
+        )
+
+        if self.previous_operation.get("username"):
+            details_text += f"<b>User:</b> {self.previous_operation['username']}<br>"
+
+        return details_text
+
+    def _update_contents(self, operation_type: str, previous_operation: dict):
+        """
+        Refresh the dynamic fields for a new duplicate-operation prompt.
+
+        Args:
+            operation_type: Type of operation (download/print)
+            previous_operation: Dict with previous operation details
+        """
+        self.operation_type = operation_type
+        self.previous_operation = previous_operation
+        self.reason = None
+
+        self.details_label.setText(self._build_details_text())
+        self.continue_btn.setText(f"Continue with {operation_type.title()}")
+        self.preset_combo.setCurrentIndex(0)
+        # Clearing re-fires on_text_changed, resetting counter and button
+        self.reason_text.clear()
+
+    @classmethod
+    def prompt(
+        cls, parent, operation_type: str, previous_operation: dict
+    ) -> Optional[str]:
+        """
+        Show the reason dialog, reusing one instance per process.
+
+        Args:
+            parent: Parent widget
+            operation_type: Type of operation (download/print)
+            previous_operation: Dict with previous operation details
+
+        Returns:
+            Reason string if accepted, None if cancelled
+        """
+        dialog = cls._shared_instance
+        if dialog is None or dialog.parent() is not parent:
+            dialog = cls(parent, operation_type, previous_operation)
+            cls._shared_instance = dialog
+        else:
+            dialog._update_contents(operation_type, previous_operation)
+        return dialog.get_reason()
+
+    def _theme_styles(self) -> dict:
+        """
+        Build (or fetch) the generated style strings for the current palette.
+
+        Returns:
+            Dict of stylesheet strings and status colors for this theme
+        """
         palette = self.palette
         is_dark = self.is_dark
 
+        # Reuse styles already generated for this palette
+        palette_key = palette.cacheKey()
+        cached = self._style_cache.get(palette_key)
+        if cached is not None:
+            return cached
+
+        # Resolve each palette role exactly once; every lookup crosses
+        # into Qt and allocates a QColor temporary
+        window = palette.color(QPalette.Window)
+        highlight = palette.color(QPalette.Highlight)
+        text_color = palette.color(QPalette.Text).name()
+        border_color = palette.color(QPalette.Mid).name()
+        button_primary = highlight.name()
+        button_primary_text = palette.color(QPalette.HighlightedText).name()
+        window_bg = window.name()
+        highlight_hover = highlight.lighter(110).name()
+
         # Define colors based on theme
         if is_dark:
             warning_color = "#fbbf24"  # Brighter yellow for dark mode
-            details_bg = palette.color(QPalette.Window).lighter(120).name()
-            text_color = palette.color(QPalette.Text).name()
-            border_color = palette.color(QPalette.Mid).name()
-            button_primary = palette.color(QPalette.Highlight).name()
-            button_primary_text = palette.color(QPalette.HighlightedText).name()
+            details_bg = window.lighter(120).name()
             success_color = "#10b981"
             error_color = "#ef4444"
-            muted_color = palette.color(QPalette.Mid).name()
+            muted_color = border_color
         else:
             warning_color = "#d97706"  # Orange for light mode
-            details_bg = palette.color(QPalette.Window).darker(105).name()
-            text_color = palette.color(QPalette.Text).name()
-            border_color = palette.color(QPalette.Mid).name()
-            button_primary = palette.color(QPalette.Highlight).name()
-            button_primary_text = palette.color(QPalette.HighlightedText).name()
+            details_bg = window.darker(105).name()
             success_color = "#059669"
             error_color = "#dc2626"
             muted_color = "#6b7280"
 
-        # Store colors for dynamic updates
-        self.success_color = success_color
-        self.error_color = error_color
-        self.muted_color = muted_color
-
-        # Apply styles
-        self.warning_label.setStyleSheet(
-            f"font-size: 14pt; font-weight: bold; color: {warning_color}; padding: 10px;"
-        )
-
-        self.details_label.setStyleSheet(
-            f"padding: 10px; background-color: {details_bg}; border-radius: 5px; color: {text_color};"
-        )
-
         # Apply global dialog stylesheet
         stylesheet = f"""
             QGroupBox {{
@@ -264,28 +406,83 @@ class ReprintReasonDialog(QDialog):
             }}
 
             QPushButton:enabled:hover {{
-                background-color: {palette.color(QPalette.Highlight).lighter(110).name()};
+                background-color: {highlight_hover};
             }}
 
             QPushButton:disabled {{
-                background-color: {palette.color(QPalette.Window).name()};
+                background-color: {window_bg};
                 color: {muted_color};
                 border: 1px solid {border_color};
             }}
         """
 
-        self.setStyleSheet(stylesheet)
-        self.continue_btn.setStyleSheet(continue_btn_style)
+        styles = {
+            "dialog": stylesheet,
+            "continue_btn": continue_btn_style,
+            "warning_label": (
+                f"font-size: 14pt; font-weight: bold; "
+                f"color: {warning_color}; padding: 10px;"
+            ),
+            "details_label": (
+                f"padding: 10px; background-color: {details_bg}; "
+                f"border-radius: 5px; color: {text_color};"
+            ),
+            # One counter stylesheet with all states; on_text_changed
+            # switches between them via the counterState property
+            "counter": f"""
+                QLabel {{ color: {muted_color}; font-size: 9pt; }}
+                QLabel[counterState="ok"] {{
+                    color: {success_color}; font-weight: bold;
+                }}
+                QLabel[counterState="error"] {{
+                    color: {error_color}; font-weight: bold;
+                }}
+            """,
+        }
+        ReprintReasonDialog._style_cache[palette_key] = styles
+        return styles
+
+    def apply_theme(self):
+        """Apply theme-aware styling to dialog components."""
+        styles = self._theme_styles()
 
-        # Update char counter with default color
-        self.char_counter.setStyleSheet(f"color: {muted_color}; font-size: 9pt;")
+        self.warning_label.setStyleSheet(styles["warning_label"])
+        self.details_label.setStyleSheet(styles["details_label"])
+        self.setStyleSheet(styles["dialog"])
+        self.continue_btn.setStyleSheet(styles["continue_btn"])
+
+        # The counter stylesheet is installed once; state changes only
+        # flip the counterState property
+        self._counter_state = "neutral"
+        self.char_counter.setProperty("counterState", self._counter_state)
+        self.char_counter.setStyleSheet(styles["counter"])
+
+    def _set_counter_state(self, state: str):
+        """
+        Switch the character counter's color state.
+
+        Re-polishing only happens when the state actually changes, so
+        steady typing inside one state never touches the style engine.
+
+        Args:
+            state: One of "neutral", "ok", or "error"
+        """
+        if state == self._counter_state:
+            return
+        self._counter_state = state
+        self.char_counter.setProperty("counterState", state)
+        style = self.char_counter.style()
+        style.unpolish(self.char_counter)
+        style.polish(self.char_counter)
 
     def on_preset_selected(self, index: int):
         """Handle preset reason selection."""
         if index > 0:  # Not the placeholder item
-            preset_reason = self.preset_combo.currentText()
+            # Resolve the reason from the index; the combo rows mirror
+            # PRESET_REASONS, so no currentText round-trip is needed
+            preset_reason = self.PRESET_REASONS[index - 1]
             # If "Other" is selected, just clear the text
-            if preset_reason != "Other (please specify)":
+            if preset_reason is not self.OTHER_REASON:
                 # Prepend preset reason to text
                 current_text = self.reason_text.toPlainText()
                 if not current_text.startswith(preset_reason):
@@ -293,39 +490,56 @@ class ReprintReasonDialog(QDialog):
 
     def on_text_changed(self):
         """Handle text changes and update character counter."""
-        text = self.reason_text.toPlainText().strip()
-        char_count = len(text)
+        if self._truncating:
+            return
 
-        # Update counter
-        self.char_counter.setText(f"{char_count} / {self.MAX_REASON_LENGTH} characters (minimum {self.MIN_REASON_LENGTH} required)")
+        # characterCount includes the final paragraph separator; reading
+        # it avoids copying the whole document to Python per keystroke
+        document = self.reason_text.document()
+        char_count = document.characterCount() - 1
 
-        # Enforce max length
+        # Enforce max length by deleting the excess in place, rather than
+        # rebuilding the document with setPlainText (which would re-emit
+        # textChanged with the full-copy path)
         if char_count > self.MAX_REASON_LENGTH:
-            # Truncate text
-            cursor = self.reason_text.textCursor()
-            cursor_pos = cursor.position()
-            self.reason_text.setPlainText(text[:self.MAX_REASON_LENGTH])
-            cursor.setPosition(min(cursor_pos, self.MAX_REASON_LENGTH))
-            self.reason_text.setTextCursor(cursor)
-            return
+            self._truncating = True
+            try:
+                cursor = QTextCursor(document)
+                cursor.setPosition(self.MAX_REASON_LENGTH)
+                cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+                cursor.removeSelectedText()
+            finally:
+                self._truncating = False
+            char_count = self.MAX_REASON_LENGTH
+
+        # Update counter only when the displayed count actually changed
+        if char_count != self._last_char_count:
+            self._last_char_count = char_count
+            self.char_counter.setText(self.COUNTER_FORMAT % char_count)
 
         # Update button state and counter color (using theme-aware colors)
         if char_count >= self.MIN_REASON_LENGTH:
             self.continue_btn.setEnabled(True)
-            self.char_counter.setStyleSheet(f"color: {self.success_color}; font-size: 9pt; font-weight: bold;")
+            self._set_counter_state("ok")
         else:
             self.continue_btn.setEnabled(False)
-            if char_count > 0:
-                self.char_counter.setStyleSheet(f"color: {self.error_color}; font-size: 9pt; font-weight: bold;")
-            else:
-                self.char_counter.setStyleSheet(f"color: {self.muted_color}; font-size: 9pt;")
+            self._set_counter_state("error" if char_count > 0 else "neutral")
 
     def accept_with_validation(self):
         """Validate and accept the dialog."""
         text = self.reason_text.toPlainText().strip()
 
         if len(text) < self.MIN_REASON_LENGTH:
-            # This shouldn't happen due to button state, but extra validation
+            # The live counter tracks the raw length, so padding the text
+            # with whitespace can enable the button while the stripped
+            # reason is still too short — explain rather than ignore the
+            # click
+            QMessageBox.warning(
+                self,
+                "Reason Too Short",
+                f"Please enter at least {self.MIN_REASON_LENGTH} characters, "
+                "not counting leading or trailing spaces.",
+            )
             return
 
         if len(text) > self.MAX_REASON_LENGTH:
@@ -3,15 +3,89 @@
 import hashlib
 import json
 import os
-import shutil
 import sqlite3
 import subprocess
+import threading
 import time
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=128)
+def _operation_hash(
+    time_point: str,
+    center_code: str,
+    hospital_number: str,
+    sorted_pdfs: tuple,
+    operation_type: str,
+    merge_flag: bool,
+) -> str:
+    """
+    Hash an operation's composite key, memoized on the argument tuple.
+
+    Args:
+        time_point: Time point (A0/A1/A2)
+        center_code: Center code (CMC/MNP/LDH)
+        hospital_number: Patient hospital number
+        sorted_pdfs: Sorted tuple of PDF filenames
+        operation_type: Operation type (download/print)
+        merge_flag: Whether PDFs were merged
+
+    Returns:
+        Hex digest string (32-byte BLAKE2b)
+    """
+    # Stream the fields straight into the hash in a fixed order, with a
+    # unit separator terminating each field so no two field sequences can
+    # collide by concatenation. BLAKE2b is faster than SHA256 in software
+    # and more than strong enough for a local dedup key.
+    hasher = hashlib.blake2b(digest_size=32)
+    for field in (
+        time_point,
+        center_code,
+        hospital_number,
+        operation_type,
+        "1" if merge_flag else "0",
+        *sorted_pdfs,
+    ):
+        hasher.update(field.encode())
+        hasher.update(b"\x1f")
+    return hasher.hexdigest()
+
+
+# SQL statements as module constants: the strings stay interned, so the
+# sqlite3 statement cache (keyed by the exact string) always hits on the
+# hot paths
+_SELECT_DUPLICATE_SQL = """
+SELECT id, timestamp, operation_type, time_point, center_code,
+       hospital_number, merge_flag, username
+FROM operations
+WHERE operation_hash = ?
+"""
+
+_SELECT_FILES_SQL = """
+SELECT filename FROM operation_files WHERE operation_id = ? ORDER BY filename
+"""
+
+_INSERT_OPERATION_SQL = """
+INSERT INTO operations (
+    timestamp, operation_type, time_point, center_code,
+    hospital_number, merge_flag, is_duplicate,
+    reprint_reason, username, operation_hash, file_count,
+    output_path
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(operation_hash) DO UPDATE SET
+    timestamp = excluded.timestamp,
+    is_duplicate = 1,
+    reprint_reason = excluded.reprint_reason
+RETURNING id
+"""
+
+_INSERT_FILE_SQL = """
+INSERT OR IGNORE INTO operation_files (operation_id, filename) VALUES (?, ?)
+"""
+
+
 class OperationLogger:
     """Manages operation logging and duplicate detection using SQLite database."""
 
@@ -25,6 +99,16 @@ class OperationLogger:
         self.db_path = db_path
         self.conn = None
 
+        # Operations logged since the last PRAGMA optimize
+        self._ops_since_optimize = 0
+
+        # The login name cannot change within the process; resolve the
+        # per-call syscall once
+        try:
+            self._username = os.getlogin()
+        except Exception:
+            self._username = os.getenv("USERNAME") or os.getenv("USER") or "unknown"
+
         # Ensure parent directory exists
         try:
             db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -37,9 +121,15 @@ class OperationLogger:
         # Initialize database
         self._init_database()
 
-        # Set restrictive file permissions (Windows only)
-        if os.name == "nt":
-            self._set_file_permissions()
+        # Set restrictive file permissions (Windows only). A sentinel file
+        # records that the ACL is already applied, so later launches skip
+        # the icacls process entirely; when it does need to run, it runs
+        # in the background so startup is not blocked on process spawn.
+        self._acl_marker = self.db_path.with_name(self.db_path.name + ".acl_set")
+        if os.name == "nt" and not self._acl_marker.exists():
+            threading.Thread(
+                target=self._set_file_permissions, daemon=True
+            ).start()
 
     def _init_database(self):
         """Initialize database with schema and indices."""
@@ -48,66 +138,117 @@ class OperationLogger:
 
         try:
             # Connect to database
+            # The logger is only touched from the GUI thread, so the
+            # default same-thread check stays on: it is free and catches
+            # accidental cross-thread use early
             self.conn = sqlite3.connect(
                 str(self.db_path),
-                check_same_thread=False,
                 timeout=10.0,
+                cached_statements=128,
             )
 
+            # Name-based row access in C, so result dicts can be built
+            # straight from the row instead of indexing tuples by hand
+            self.conn.row_factory = sqlite3.Row
+
             # Enable Write-Ahead Logging for better concurrency
             self.conn.execute("PRAGMA journal_mode=WAL")
             self.conn.execute("PRAGMA foreign_keys=ON")
 
-            # Test integrity if database exists
+            # Tune for the write-heavy logging workload: NORMAL sync is
+            # durable enough under WAL (a crash can lose the last commit
+            # but never corrupts), keep temp structures and a few MB of
+            # page cache in memory
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-4096")
+
+            # Test integrity if database exists, but only after an unclean
+            # shutdown: close() sets user_version to 1, and we reset it to
+            # 0 below while the app runs. A full integrity_check scans the
+            # whole file, so the cheaper quick_check is used here.
             if db_exists:
-                result = self.conn.execute("PRAGMA integrity_check").fetchone()
-                if result[0] != "ok":
-                    raise sqlite3.DatabaseError("Database integrity check failed")
+                clean_shutdown = self.conn.execute("PRAGMA user_version").fetchone()[0]
+                if clean_shutdown != 1:
+                    result = self.conn.execute("PRAGMA quick_check").fetchone()
+                    if result[0] != "ok":
+                        raise sqlite3.DatabaseError("Database integrity check failed")
+
+            # Mark the database as in-use; flipped back to 1 on clean close
+            self.conn.execute("PRAGMA user_version=0")
 
             # Create schema if not exists
             self._create_schema()
 
         except sqlite3.DatabaseError as e:
             if db_exists:
-                # Backup corrupted database
+                # Release the file before renaming (required on Windows)
+                if self.conn is not None:
+                    try:
+                        self.conn.close()
+                    except Exception:
+                        pass
+                    self.conn = None
+
+                # Move the corrupted database aside: a rename is atomic,
+                # metadata-only and leaves the original path free for the
+                # rebuild, so there is no need to copy the file contents.
+                # The WAL sidecars go with it so they can't be replayed
+                # into the fresh database.
                 backup_path = self.db_path.with_suffix(".db.corrupted.bak")
                 try:
-                    shutil.copy2(self.db_path, backup_path)
+                    self.db_path.replace(backup_path)
                     print(f"Database corrupted, backup created: {backup_path}")
                 except Exception:
                     pass
-
-                # Delete and recreate
-                try:
-                    self.db_path.unlink()
-                except Exception:
-                    pass
+                for suffix in ("-wal", "-shm"):
+                    sidecar = self.db_path.with_name(self.db_path.name + suffix)
+                    try:
+                        sidecar.replace(backup_path.with_name(backup_path.name + suffix))
+                    except FileNotFoundError:
+                        pass
+                    except Exception:
+                        pass
 
                 # Retry initialization
                 self._init_database()
             else:
                 raise
 
+    # Per-operation filenames live in a child table rather than a JSON
+    # blob on the operations row: no json.loads on every duplicate hit,
+    # and file-level queries ("how often was arat.pdf printed") become
+    # plain SQL
+    _CREATE_OPERATIONS_SQL = """
+    CREATE TABLE IF NOT EXISTS operations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        operation_type TEXT NOT NULL,
+        time_point TEXT NOT NULL,
+        center_code TEXT NOT NULL,
+        hospital_number TEXT NOT NULL,
+        merge_flag INTEGER NOT NULL,
+        is_duplicate INTEGER NOT NULL,
+        reprint_reason TEXT,
+        username TEXT,
+        operation_hash TEXT NOT NULL,
+        file_count INTEGER NOT NULL,
+        output_path TEXT
+    )
+    """
+
+    _CREATE_FILES_SQL = """
+    CREATE TABLE IF NOT EXISTS operation_files (
+        operation_id INTEGER NOT NULL,
+        filename TEXT NOT NULL,
+        PRIMARY KEY (operation_id, filename),
+        FOREIGN KEY (operation_id) REFERENCES operations(id) ON DELETE CASCADE
+    )
+    """
+
     def _create_schema(self):
         """Create database tables and indices."""
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS operations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            operation_type TEXT NOT NULL,
-            time_point TEXT NOT NULL,
-            center_code TEXT NOT NULL,
-            hospital_number TEXT NOT NULL,
-            pdf_files TEXT NOT NULL,
-            merge_flag INTEGER NOT NULL,
-            is_duplicate INTEGER NOT NULL,
-            reprint_reason TEXT,
-            username TEXT,
-            operation_hash TEXT NOT NULL,
-            file_count INTEGER NOT NULL,
-            output_path TEXT
-        )
-        """
+        self._migrate_pdf_files_column()
 
         create_hash_index = """
         CREATE UNIQUE INDEX IF NOT EXISTS idx_operation_hash
@@ -124,16 +265,86 @@ class OperationLogger:
         ON operations(timestamp)
         """
 
-        self.conn.execute(create_table_sql)
+        self.conn.execute(self._CREATE_OPERATIONS_SQL)
+        self.conn.execute(self._CREATE_FILES_SQL)
         self.conn.execute(create_hash_index)
         self.conn.execute(create_hospital_index)
         self.conn.execute(create_timestamp_index)
         self.conn.commit()
 
+    def _migrate_pdf_files_column(self):
+        """Move legacy pdf_files JSON blobs into the operation_files table."""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(operations)")]
+        if "pdf_files" not in columns:
+            return
+
+        # Expand the JSON arrays into (operation_id, filename) rows before
+        # the old table goes away, and recompute each row's operation_hash
+        # from its own fields: hashes stored by older versions used a
+        # different format and would never match again, which would let
+        # repeats of historical operations slip past the duplicate check
+        file_rows = []
+        migrated_rows = []
+        for row in self.conn.execute("SELECT * FROM operations"):
+            filenames = json.loads(row["pdf_files"])
+            file_rows.extend((row["id"], filename) for filename in filenames)
+            migrated_rows.append((
+                row["id"],
+                row["timestamp"],
+                row["operation_type"],
+                row["time_point"],
+                row["center_code"],
+                row["hospital_number"],
+                row["merge_flag"],
+                row["is_duplicate"],
+                row["reprint_reason"],
+                row["username"],
+                _operation_hash(
+                    row["time_point"],
+                    row["center_code"],
+                    row["hospital_number"],
+                    tuple(sorted(filenames)),
+                    row["operation_type"],
+                    bool(row["merge_flag"]),
+                ),
+                row["file_count"],
+                row["output_path"],
+            ))
+
+        # Standard SQLite table rewrite: build the replacement, copy the
+        # surviving columns, swap it in. Foreign keys are suspended so the
+        # DROP does not trip over operation_files references.
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self.conn:
+                self.conn.execute(
+                    self._CREATE_OPERATIONS_SQL.replace(
+                        "IF NOT EXISTS operations", "operations_migrated"
+                    )
+                )
+                self.conn.executemany(
+                    """
+                    INSERT INTO operations_migrated (
+                        id, timestamp, operation_type, time_point, center_code,
+                        hospital_number, merge_flag, is_duplicate, reprint_reason,
+                        username, operation_hash, file_count, output_path
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    migrated_rows,
+                )
+                self.conn.execute("DROP TABLE operations")
+                self.conn.execute(
+                    "ALTER TABLE operations_migrated RENAME TO operations"
+                )
+                self.conn.execute(self._CREATE_FILES_SQL)
+                self.conn.executemany(_INSERT_FILE_SQL, file_rows)
+        finally:
+            self.conn.execute("PRAGMA foreign_keys=ON")
+
     def _set_file_permissions(self):
         """Set restrictive Windows ACLs on database file (current user only)."""
         try:
-            username = os.getlogin()
+            username = self._username
 
             # Remove inherited permissions and grant only current user full control
             subprocess.run(
@@ -148,6 +359,8 @@ class OperationLogger:
                 capture_output=True,
                 text=True,
             )
+            # Only mark success; a failed run is retried on next launch
+            self._acl_marker.touch()
         except (subprocess.CalledProcessError, Exception) as e:
             # Log warning but don't fail - file will use default permissions
             print(f"Warning: Could not set restrictive permissions: {e}")
@@ -162,7 +375,7 @@ class OperationLogger:
         merge_flag: bool,
     ) -> str:
         """
-        Calculate SHA256 hash for duplicate detection (order-independent).
+        Calculate hash for duplicate detection (order-independent).
 
         Args:
             time_point: Time point (A0/A1/A2)
@@ -173,26 +386,19 @@ class OperationLogger:
             merge_flag: Whether PDFs were merged
 
         Returns:
-            SHA256 hash string
+            Hex digest string
         """
-        # Sort PDF files for order-independent comparison
-        sorted_pdfs = sorted(pdf_files)
-
-        # Create composite key
-        composite = {
-            "time_point": time_point,
-            "center_code": center_code,
-            "hospital_number": hospital_number,
-            "pdf_files": sorted_pdfs,
-            "operation_type": operation_type,
-            "merge_flag": merge_flag,
-        }
-
-        # Convert to JSON string (sorted keys for consistency)
-        json_str = json.dumps(composite, sort_keys=True)
-
-        # Calculate SHA256 hash
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        # Sort PDF files for order-independent comparison; the tuple makes
+        # the arguments hashable so repeated calls for the same operation
+        # (duplicate check, then logging) hit the memoized helper
+        return _operation_hash(
+            time_point,
+            center_code,
+            hospital_number,
+            tuple(sorted(pdf_files)),
+            operation_type,
+            merge_flag,
+        )
 
     def check_duplicate(
         self,
@@ -202,6 +408,7 @@ class OperationLogger:
         pdf_files: list[str],
         operation_type: str,
         merge_flag: bool,
+        operation_hash: Optional[str] = None,
     ) -> Optional[dict]:
         """
         Check if operation is duplicate.
@@ -213,43 +420,30 @@ class OperationLogger:
             pdf_files: List of PDF filenames
             operation_type: Operation type (download/print)
             merge_flag: Whether PDFs will be merged
+            operation_hash: Precomputed operation hash, if the caller
+                already has one (avoids rehashing per call)
 
         Returns:
             None if not duplicate, else dict with previous operation details
         """
-        # Calculate operation hash
-        operation_hash = self.calculate_operation_hash(
-            time_point, center_code, hospital_number, pdf_files, operation_type, merge_flag
-        )
+        # Calculate operation hash unless the caller supplied it
+        if operation_hash is None:
+            operation_hash = self.calculate_operation_hash(
+                time_point, center_code, hospital_number, pdf_files, operation_type, merge_flag
+            )
 
         # Query database for matching hash
         try:
-            cursor = self.conn.execute(
-                """
-                SELECT id, timestamp, operation_type, time_point, center_code,
-                       hospital_number, pdf_files, merge_flag, username
-                FROM operations
-                WHERE operation_hash = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                (operation_hash,),
-            )
+            cursor = self.conn.execute(_SELECT_DUPLICATE_SQL, (operation_hash,))
 
             row = cursor.fetchone()
 
             if row:
-                return {
-                    "id": row[0],
-                    "timestamp": row[1],
-                    "operation_type": row[2],
-                    "time_point": row[3],
-                    "center_code": row[4],
-                    "hospital_number": row[5],
-                    "pdf_files": json.loads(row[6]),
-                    "merge_flag": bool(row[7]),
-                    "username": row[8],
-                }
+                files = self.conn.execute(_SELECT_FILES_SQL, (row["id"],))
+                result = dict(row)
+                result["pdf_files"] = [filename for (filename,) in files]
+                result["merge_flag"] = bool(result["merge_flag"])
+                return result
 
             return None
 
@@ -268,6 +462,7 @@ class OperationLogger:
         is_duplicate: bool,
         reprint_reason: Optional[str],
         output_path: Optional[str],
+        operation_hash: Optional[str] = None,
     ) -> int:
         """
         Log operation to database.
@@ -282,87 +477,153 @@ class OperationLogger:
             is_duplicate: Whether this is a duplicate operation
             reprint_reason: Reason for duplicate (if applicable)
             output_path: Where files were saved (None for print)
+            operation_hash: Precomputed operation hash, if the caller
+                already has one (avoids rehashing per call)
 
         Returns:
             Record ID of inserted operation
         """
-        # Calculate operation hash
-        operation_hash = self.calculate_operation_hash(
-            time_point, center_code, hospital_number, pdf_files, operation_type, merge_flag
+        params = self._operation_params(
+            time_point,
+            center_code,
+            hospital_number,
+            pdf_files,
+            operation_type,
+            merge_flag,
+            is_duplicate,
+            reprint_reason,
+            output_path,
+            operation_hash,
         )
 
-        # Get current timestamp (ISO 8601 format)
-        timestamp = datetime.now().isoformat()
+        # Lock contention is handled by the connection's busy timeout
+        # (SQLite blocks and retries in C for up to 10 s), so no Python
+        # retry loop is needed. Repeating an operation upserts its
+        # existing row in the same statement.
+        cursor = self.conn.execute(_INSERT_OPERATION_SQL, params)
+
+        record_id = cursor.fetchone()[0]
+        # A reprint upserts the same row (identical hash means identical
+        # file set), so OR IGNORE makes the filename rows idempotent
+        self.conn.executemany(
+            _INSERT_FILE_SQL, ((record_id, filename) for filename in pdf_files)
+        )
+        self.conn.commit()
+        self._maybe_optimize()
+        return record_id
 
-        # Get username
-        try:
-            username = os.getlogin()
-        except Exception:
-            username = os.getenv("USERNAME") or os.getenv("USER") or "unknown"
+    def log_operations(self, records: list[dict]) -> list[int]:
+        """
+        Log several operations in a single transaction.
 
-        # Prepare data
-        pdf_files_json = json.dumps(sorted(pdf_files))
-        file_count = len(pdf_files)
+        Committing once for the whole batch avoids the per-row WAL sync
+        that dominates bulk logging (e.g. a future CSV batch workflow).
 
-        # Insert with retry logic for concurrent access
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                cursor = self.conn.execute(
-                    """
-                    INSERT INTO operations (
-                        timestamp, operation_type, time_point, center_code,
-                        hospital_number, pdf_files, merge_flag, is_duplicate,
-                        reprint_reason, username, operation_hash, file_count,
-                        output_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        timestamp,
-                        operation_type,
-                        time_point,
-                        center_code,
-                        hospital_number,
-                        pdf_files_json,
-                        1 if merge_flag else 0,
-                        1 if is_duplicate else 0,
-                        reprint_reason,
-                        username,
-                        operation_hash,
-                        file_count,
-                        output_path,
-                    ),
-                )
+        Args:
+            records: List of dicts, each holding the keyword arguments
+                accepted by log_operation
 
-                self.conn.commit()
-                return cursor.lastrowid
+        Returns:
+            Record IDs in the same order as the input records
+        """
+        record_ids = []
 
-            except sqlite3.IntegrityError:
-                # Hash collision (duplicate) - this is expected, just update
-                # with the new timestamp and reason
+        # The first execute opens the transaction; the with-block commits
+        # it once at the end (or rolls everything back on error)
+        with self.conn:
+            for record in records:
                 cursor = self.conn.execute(
-                    """
-                    UPDATE operations
-                    SET timestamp = ?, is_duplicate = 1, reprint_reason = ?
-                    WHERE operation_hash = ?
-                    """,
-                    (timestamp, reprint_reason, operation_hash),
+                    _INSERT_OPERATION_SQL, self._operation_params(**record)
+                )
+                record_id = cursor.fetchone()[0]
+                self.conn.executemany(
+                    _INSERT_FILE_SQL,
+                    ((record_id, filename) for filename in record["pdf_files"]),
                 )
-                self.conn.commit()
-                return cursor.lastrowid
+                record_ids.append(record_id)
+
+        self._maybe_optimize(count=len(records))
+        return record_ids
+
+    def _operation_params(
+        self,
+        time_point: str,
+        center_code: str,
+        hospital_number: str,
+        pdf_files: list[str],
+        operation_type: str,
+        merge_flag: bool,
+        is_duplicate: bool,
+        reprint_reason: Optional[str],
+        output_path: Optional[str],
+        operation_hash: Optional[str] = None,
+    ) -> tuple:
+        """
+        Build the bind-parameter tuple for the operation INSERT.
+
+        Args:
+            (same as log_operation)
 
-            except sqlite3.OperationalError as e:
-                if "locked" in str(e).lower() and attempt < max_retries - 1:
-                    # Database locked, retry with exponential backoff
-                    time.sleep(0.1 * (attempt + 1))
-                else:
-                    raise
+        Returns:
+            Parameter tuple matching _INSERT_OPERATION_SQL
+        """
+        # Calculate operation hash unless the caller supplied it
+        if operation_hash is None:
+            operation_hash = self.calculate_operation_hash(
+                time_point, center_code, hospital_number, pdf_files, operation_type, merge_flag
+            )
 
-        raise sqlite3.OperationalError("Failed to log operation after retries")
+        # Current timestamp in ISO 8601 format, via the C-implemented
+        # strftime rather than building a datetime object just to format it
+        now = time.time()
+        timestamp = (
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+            + f".{int((now % 1) * 1e6):06d}"
+        )
+
+        return (
+            timestamp,
+            operation_type,
+            time_point,
+            center_code,
+            hospital_number,
+            1 if merge_flag else 0,
+            1 if is_duplicate else 0,
+            reprint_reason,
+            self._username,
+            operation_hash,
+            len(pdf_files),
+            output_path,
+        )
+
+    def _maybe_optimize(self, count: int = 1, every: int = 500):
+        """
+        Refresh query-planner statistics after a batch of writes.
+
+        Args:
+            count: Number of operations just written
+            every: Number of logged operations between optimize runs
+        """
+        self._ops_since_optimize += count
+        if self._ops_since_optimize >= every:
+            self._ops_since_optimize = 0
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
 
     def close(self):
         """Close database connection."""
         if self.conn:
+            # Let SQLite refresh planner statistics while we still can
+            # (cheap when nothing changed, per the SQLite docs), and mark
+            # the shutdown as clean so the next startup can skip the
+            # integrity check
+            try:
+                self.conn.execute("PRAGMA optimize")
+                self.conn.execute("PRAGMA user_version=1")
+            except sqlite3.Error:
+                pass
             self.conn.close()
             self.conn = None
 
@@ -1,14 +1,19 @@
 """Path utilities for finding resources in both development and packaged modes."""
 
+import os
 import sys
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_base_dir() -> Path:
     """
     Get the base application directory.
 
     Works in both development mode and when packaged with PyInstaller.
+    The result is constant for the process lifetime, so it is computed
+    once and cached.
     """
     if getattr(sys, "frozen", False):
         # Running as compiled executable (PyInstaller)
@@ -18,23 +23,28 @@ def get_base_dir() -> Path:
         return Path(__file__).parent.parent
 
 
+@cache
 def get_files_dir() -> Path:
     """
     Get the path to the files directory containing PDFs.
 
     Works in both development mode and when packaged with PyInstaller.
+    Cached after the first successful lookup, skipping the exists()
+    stat calls on later calls; a raised FileNotFoundError is not cached,
+    so a directory created later is still picked up.
     """
     base_dir = get_base_dir()
-    files_dir = base_dir / "files"
 
-    # If files dir not found at expected location, try looking up
-    if not files_dir.exists():
-        # Try one level up (in case of nested package structure)
-        files_dir = base_dir.parent / "files"
-
-    if not files_dir.exists():
-        raise FileNotFoundError(
-            f"Files directory not found. Searched: {base_dir / 'files'}"
-        )
-
-    return files_dir
+    # Probe each candidate with one os.stat each: the expected location,
+    # then one level up (in case of nested package structure)
+    candidates = (base_dir / "files", base_dir.parent / "files")
+    for files_dir in candidates:
+        try:
+            os.stat(files_dir)
+        except FileNotFoundError:
+            continue
+        return files_dir
+
+    raise FileNotFoundError(
+        f"Files directory not found. Searched: {base_dir / 'files'}"
+    )
@@ -3,6 +3,9 @@
 import re
 from typing import Tuple
 
+# Compiled once at import; fullmatch avoids anchoring overhead per call
+_HOSPITAL_NUMBER_RE = re.compile(r"[a-zA-Z0-9\-]+")
+
 
 def validate_hospital_number(number: str) -> Tuple[bool, str]:
     """
@@ -25,8 +28,10 @@ def validate_hospital_number(number: str) -> Tuple[bool, str]:
     if len(number) > 20:
         return False, "Hospital number cannot exceed 20 characters"
 
-    # Check if it contains only alphanumeric characters and hyphens
-    if not re.match(r"^[a-zA-Z0-9\-]+$", number):
+    # Check if it contains only alphanumeric characters and hyphens.
+    # Plain ASCII-alphanumeric input (the common case) short-circuits
+    # before the regex engine is entered.
+    if not (number.isalnum() and number.isascii()) and not _HOSPITAL_NUMBER_RE.fullmatch(number):
         return False, "Hospital number can only contain letters, numbers, and hyphens"
 
     return True, ""